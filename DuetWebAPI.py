@@ -183,6 +183,29 @@ class DuetWebAPI:
 
         return({'X':0,'Y':0,'Z':0})      # Dummy for now              
 
+    def getToolOffsets(self):
+        # G10 offsets for all tools from a single status request
+        if (self.pt == 3):
+            URL=(f'{self._base_url}'+'/machine/status')
+            r = self.requests.get(URL,timeout=8)
+            j = self.json.loads(r.text)
+            if 'result' in j: j = j['result']
+            ja=[axis['letter'] for axis in j['move']['axes']]
+            jt=j['tools']
+        elif (self.pt == 2):
+            URL=(f'{self._base_url}'+'/rr_status?type=2')
+            r = self.requests.get(URL,timeout=8)
+            j = self.json.loads(r.text)
+            ja=j['axisNames']
+            jt=j['tools']
+        else:
+            return([])
+        ret=[]
+        for tool in jt:
+            to = tool['offsets']
+            ret.append({ ja[i]: to[i] for i in range(0,len(to)) })
+        return(ret)
+
     def getNumExtruders(self):
         if (self.pt == 2):
             URL=(f'{self._base_url}'+'/rr_status?type=2')
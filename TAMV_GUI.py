@@ -45,8 +45,8 @@ from PyQt5.QtWidgets import (
     QVBoxLayout,
     QWidget
 )
-from PyQt5.QtGui import QPixmap, QImage, QPainter, QColor, QIcon
-from PyQt5.QtCore import pyqtSignal, pyqtSlot, Qt, QThread, QMutex, QPoint, QSize
+from PyQt5.QtGui import QPixmap, QImage, QPainter, QColor, QIcon, QRegularExpressionValidator
+from PyQt5.QtCore import pyqtSignal, pyqtSlot, Qt, QThread, QMutex, QPoint, QSize, QTimer, QWaitCondition, QSignalBlocker, QRegularExpression
 
 # Core imports
 import os
@@ -55,27 +55,69 @@ import cv2
 import numpy as np
 import math
 import DuetWebAPI as DWA
-from time import sleep, time
 import datetime
 import json
+from urllib.parse import urlparse
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from contextlib import contextmanager
 
-
-# graphing imports
-import matplotlib
-import matplotlib.pyplot as plt
-import matplotlib.cm as cm
-import matplotlib.patches as patches
-from matplotlib.ticker import FormatStrFormatter
+# graphing imports are deferred to analyzeResults(graph=True)
 
 default_minCircularity = 0.7
 default_minArea = 300
+default_maxArea = 5000
+# capture/detection options, overridden by settings.json
+use_gstreamer = False
+use_hough = False
+# let OpenCV spread its filters over the available cores (some Python builds default to 1 thread)
+cv2.setUseOptimized(True)
+cv2.setNumThreads(max(2, (os.cpu_count() or 2)//2))
 # styles
 global style_green, style_red, style_disabled, style_orange
 style_green = 'background-color: green; color: white;'
 style_red = 'background-color: red; color: white;'
 style_disabled = 'background-color: #cccccc; color: #999999; border-style: solid;'
 style_orange = 'background-color: dark-grey; color: orange;'
+color_white = QColor(255,255,255,255)
+# Qt 5.14+ wraps OpenCV's BGR frames directly, older versions need them swapped to RGB
+qimage_bgr888 = getattr(QImage, 'Format_BGR888', None)
+# parsed settings.json, reused while the file's mtime is unchanged
+_settings_cache = {'mtime': None, 'data': None}
+# typed columns kept for each calibration result
+calibration_fields = (('tool', np.int32), ('cycle', np.int32), ('X', np.float64), ('Y', np.float64), ('mpp', np.float64))
+# printer URL validation
+_url_schemes = frozenset({'http'})
+_url_errors = {
+    1: 'Invalid scheme. Please only use http connections.',
+    2: 'Invalid IP/network address.',
+    3: 'Cannot use https connections for Duet controllers'
+}
+
+def applyStyle(widget, style):
+    # setStyleSheet re-parses and re-polishes even for an identical string, skip unchanged styles
+    if widget.styleSheet() != style:
+        widget.setStyleSheet(style)
+
+@contextmanager
+def updatesSuspended(widget):
+    # coalesce a batch of widget changes into one repaint, nested blocks leave that to the outermost one
+    if not widget.updatesEnabled():
+        yield
+        return
+    widget.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        widget.setUpdatesEnabled(True)
+
+def applyState(widget, state):
+    # status labels are coloured by the [state] selectors in tamv.qss, only re-polish on change
+    if widget.property('state') != state:
+        widget.setProperty('state', state)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
 
 class CPDialog(QDialog):
     def __init__(self,
@@ -99,98 +141,15 @@ class CPDialog(QDialog):
         self.buttons={}
         buttons_layout = QGridLayout()
 
-        # X
-        self.button_x1 = QPushButton('-1')
-        self.button_x2 = QPushButton('-0.1')
-        self.button_x3 = QPushButton('-0.01')
-        self.button_x4 = QPushButton('+0.01')
-        self.button_x5 = QPushButton('+0.1')
-        self.button_x6 = QPushButton('+1')
-        # set X sizes
-        self.button_x1.setFixedSize(60,60) 
-        self.button_x2.setFixedSize(60,60)
-        self.button_x3.setFixedSize(60,60)
-        self.button_x4.setFixedSize(60,60)
-        self.button_x5.setFixedSize(60,60)
-        self.button_x6.setFixedSize(60,60)
-        # attach actions
-        self.button_x1.clicked.connect(lambda: self.parent().printer.gCode('G91 G1 X-1 G90'))
-        self.button_x2.clicked.connect(lambda: self.parent().printer.gCode('G91 G1 X-0.1 G90'))
-        self.button_x3.clicked.connect(lambda: self.parent().printer.gCode('G91 G1 X-0.01 G90'))
-        self.button_x4.clicked.connect(lambda: self.parent().printer.gCode('G91 G1 X0.01 G90'))
-        self.button_x5.clicked.connect(lambda: self.parent().printer.gCode('G91 G1 X0.1 G90'))
-        self.button_x6.clicked.connect(lambda: self.parent().printer.gCode('G91 G1 X1 G90'))
-        # add buttons to window
-        x_label = QLabel('X')
-        buttons_layout.addWidget(x_label,0,0)
-        buttons_layout.addWidget(self.button_x1,0,1)
-        buttons_layout.addWidget(self.button_x2,0,2)
-        buttons_layout.addWidget(self.button_x3,0,3)
-        buttons_layout.addWidget(self.button_x4,0,4)
-        buttons_layout.addWidget(self.button_x5,0,5)
-        buttons_layout.addWidget(self.button_x6,0,6)
-
-        # Y
-        self.button_y1 = QPushButton('-1')
-        self.button_y2 = QPushButton('-0.1')
-        self.button_y3 = QPushButton('-0.01')
-        self.button_y4 = QPushButton('+0.01')
-        self.button_y5 = QPushButton('+0.1')
-        self.button_y6 = QPushButton('+1')
-        # set X sizes
-        self.button_y1.setFixedSize(60,60)
-        self.button_y2.setFixedSize(60,60)
-        self.button_y3.setFixedSize(60,60)
-        self.button_y4.setFixedSize(60,60)
-        self.button_y5.setFixedSize(60,60)
-        self.button_y6.setFixedSize(60,60)
-        # attach actions
-        self.button_y1.clicked.connect(lambda: self.parent().printer.gCode('G91 G1 Y-1 G90'))
-        self.button_y2.clicked.connect(lambda: self.parent().printer.gCode('G91 G1 Y-0.1 G90'))
-        self.button_y3.clicked.connect(lambda: self.parent().printer.gCode('G91 G1 Y-0.01 G90'))
-        self.button_y4.clicked.connect(lambda: self.parent().printer.gCode('G91 G1 Y0.01 G90'))
-        self.button_y5.clicked.connect(lambda: self.parent().printer.gCode('G91 G1 Y0.1 G90'))
-        self.button_y6.clicked.connect(lambda: self.parent().printer.gCode('G91 G1 Y1 G90'))
-        # add buttons to window
-        y_label = QLabel('Y')
-        buttons_layout.addWidget(y_label,1,0)
-        buttons_layout.addWidget(self.button_y1,1,1)
-        buttons_layout.addWidget(self.button_y2,1,2)
-        buttons_layout.addWidget(self.button_y3,1,3)
-        buttons_layout.addWidget(self.button_y4,1,4)
-        buttons_layout.addWidget(self.button_y5,1,5)
-        buttons_layout.addWidget(self.button_y6,1,6)
-
-        # Z
-        self.button_z1 = QPushButton('-1')
-        self.button_z2 = QPushButton('-0.1')
-        self.button_z3 = QPushButton('-0.01')
-        self.button_z4 = QPushButton('+0.01')
-        self.button_z5 = QPushButton('+0.1')
-        self.button_z6 = QPushButton('+1')
-        # set X sizes
-        self.button_z1.setFixedSize(60,60) 
-        self.button_z2.setFixedSize(60,60)
-        self.button_z3.setFixedSize(60,60)
-        self.button_z4.setFixedSize(60,60)
-        self.button_z5.setFixedSize(60,60)
-        self.button_z6.setFixedSize(60,60)
-        # attach actions
-        self.button_z1.clicked.connect(lambda: self.parent().printer.gCode('G91 G1 Z-1 G90'))
-        self.button_z2.clicked.connect(lambda: self.parent().printer.gCode('G91 G1 Z-0.1 G90'))
-        self.button_z3.clicked.connect(lambda: self.parent().printer.gCode('G91 G1 Z-0.01 G90'))
-        self.button_z4.clicked.connect(lambda: self.parent().printer.gCode('G91 G1 Z0.01 G90'))
-        self.button_z5.clicked.connect(lambda: self.parent().printer.gCode('G91 G1 Z0.1 G90'))
-        self.button_z6.clicked.connect(lambda: self.parent().printer.gCode('G91 G1 Z1 G90'))
-        # add buttons to window
-        z_label = QLabel('Z')
-        buttons_layout.addWidget(z_label,2,0)
-        buttons_layout.addWidget(self.button_z1,2,1)
-        buttons_layout.addWidget(self.button_z2,2,2)
-        buttons_layout.addWidget(self.button_z3,2,3)
-        buttons_layout.addWidget(self.button_z4,2,4)
-        buttons_layout.addWidget(self.button_z5,2,5)
-        buttons_layout.addWidget(self.button_z6,2,6)
+        # one row of jog buttons per axis
+        for row, axis in enumerate('XYZ'):
+            buttons_layout.addWidget(QLabel(axis),row,0)
+            for col, step in enumerate(['-1','-0.1','-0.01','+0.01','+0.1','+1']):
+                button = QPushButton(step)
+                button.setFixedSize(60,60)
+                button.clicked.connect(partial(self.jog, axis, step.lstrip('+')))
+                buttons_layout.addWidget(button,row,col+1)
+                self.buttons[axis + step] = button
 
         #self.macro_field = QLineEdit()
         #self.button_macro = QPushButton('Run macro')
@@ -210,6 +169,10 @@ class CPDialog(QDialog):
     def setSummaryText(self, message):
         self.cp_info.setText(message)
 
+    def jog(self, axis, step, checked=False):
+        # checked is passed through by QPushButton.clicked and ignored
+        self.parent().printer.gCode('G91 G1 ' + axis + step + ' G90')
+
 class DebugDialog(QDialog):
     def __init__(self,parent=None, message=''):
         super(DebugDialog,self).__init__(parent=parent)
@@ -280,37 +243,37 @@ class CameraSettingsDialog(QDialog):
         self.brightness_slider.setMinimum(0)
         self.brightness_slider.setMaximum(255)
         self.brightness_slider.setValue(int(brightness_input))
-        self.brightness_slider.valueChanged.connect(self.changeBrightness)
         self.brightness_slider.setTickPosition(QSlider.TicksBelow)
         self.brightness_slider.setTickInterval(1)
         self.brightness_label = QLabel(str(int(brightness_input)))
+        self.brightness_slider.valueChanged.connect(partial(self.changeProperty, 'brightness', self.brightness_label))
         # Contrast slider
         self.contrast_slider = QSlider(Qt.Horizontal)
         self.contrast_slider.setMinimum(0)
         self.contrast_slider.setMaximum(255)
         self.contrast_slider.setValue(int(contrast_input))
-        self.contrast_slider.valueChanged.connect(self.changeContrast)
         self.contrast_slider.setTickPosition(QSlider.TicksBelow)
         self.contrast_slider.setTickInterval(1)
         self.contrast_label = QLabel(str(int(contrast_input)))
+        self.contrast_slider.valueChanged.connect(partial(self.changeProperty, 'contrast', self.contrast_label))
         # Saturation slider
         self.saturation_slider = QSlider(Qt.Horizontal)
         self.saturation_slider.setMinimum(0)
         self.saturation_slider.setMaximum(255)
         self.saturation_slider.setValue(int(saturation_input))
-        self.saturation_slider.valueChanged.connect(self.changeSaturation)
         self.saturation_slider.setTickPosition(QSlider.TicksBelow)
         self.saturation_slider.setTickInterval(1)
         self.saturation_label = QLabel(str(int(saturation_input)))
+        self.saturation_slider.valueChanged.connect(partial(self.changeProperty, 'saturation', self.saturation_label))
         # Hue slider
         self.hue_slider = QSlider(Qt.Horizontal)
         self.hue_slider.setMinimum(0)
         self.hue_slider.setMaximum(8)
         self.hue_slider.setValue(int(hue_input))
-        self.hue_slider.valueChanged.connect(self.changeHue)
         self.hue_slider.setTickPosition(QSlider.TicksBelow)
         self.hue_slider.setTickInterval(1)
         self.hue_label = QLabel(str(int(hue_input)))
+        self.hue_slider.valueChanged.connect(partial(self.changeProperty, 'hue', self.hue_label))
         # Reset button
         self.reset_button = QPushButton("Reset to defaults")
         self.reset_button.setToolTip('Reset camera settings to defaults.')
@@ -392,42 +355,12 @@ class CameraSettingsDialog(QDialog):
         self.hue_slider.setValue(hue_input)
         self.hue_label.setText(str(hue_input))
 
-    def changeBrightness(self):
-        parameter = int(self.brightness_slider.value())
-        try:
-            self.parent().video_thread.setProperty(brightness=parameter)
-        except:
-            None
-        self.brightness_label.setText(str(parameter))
-
-    def changeContrast(self):
-        parameter = int(self.contrast_slider.value())
-        try:
-            self.parent().video_thread.setProperty(contrast=parameter)
-        except:
-            None
-        self.contrast_label.setText(str(parameter))
-
-    def changeSaturation(self):
-        parameter = int(self.saturation_slider.value())
-        try:
-            self.parent().video_thread.setProperty(saturation=parameter)
-        except:
-            None
-        self.saturation_label.setText(str(parameter))
-
-    def changeHue(self):
-        parameter = int(self.hue_slider.value())
-        try:
-            self.parent().video_thread.setProperty(hue=parameter)
-        except:
-            None
-        self.hue_label.setText(str(parameter))
+    def changeProperty(self, name, label, value):
+        self.parent().video_thread.setProperty(**{name: value})
+        label.setText(str(value))
 
     def getCameras(self):
         # checks the first 6 indexes.
-        i = 6
-        index = 0
         self.camera_combo.clear()
         _cameras = []
         original_camera_description = str(video_src) + ': ' \
@@ -435,25 +368,38 @@ class CameraSettingsDialog(QDialog):
             + 'x' + str(self.parent().video_thread.cap.get(cv2.CAP_PROP_FRAME_HEIGHT)) + ' @ ' \
             + str(self.parent().video_thread.cap.get(cv2.CAP_PROP_FPS)) + 'fps'
         _cameras.append(original_camera_description)
-        while i > 0:
-            if index != video_src:
-                tempCap = cv2.VideoCapture(index)
-                if tempCap.read()[0]:
-                    api = tempCap.getBackendName()
-                    camera_description = str(index) + ': ' \
-                        + str(tempCap.get(cv2.CAP_PROP_FRAME_WIDTH)) \
-                        + 'x' + str(tempCap.get(cv2.CAP_PROP_FRAME_HEIGHT)) + ' @ ' \
-                        + str(tempCap.get(cv2.CAP_PROP_FPS)) + 'fps'
-                    _cameras.append(camera_description)
-                    tempCap.release()
-            index += 1
-            i -= 1
+        # probe all indexes in parallel so failing probes don't add up
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            results = executor.map(self.probeCamera, [index for index in range(6) if index != video_src])
+        _cameras.extend([camera for camera in results if camera is not None])
         #cameras = [line for line in allOutputs if float(line['propmode']) > -1 ]
         _cameras.sort()
         for camera in _cameras:
             self.camera_combo.addItem(camera)
         self.camera_combo.setCurrentText(original_camera_description)
 
+    def probeCamera(self, index):
+        # skip indexes without a video device on Linux
+        if sys.platform.startswith('linux') and not os.path.exists('/dev/video' + str(index)):
+            return None
+        # pin the capture API so OpenCV doesn't try every backend in turn
+        if sys.platform.startswith('linux'):
+            tempCap = cv2.VideoCapture(index, cv2.CAP_V4L2)
+        elif sys.platform.startswith('win'):
+            tempCap = cv2.VideoCapture(index, cv2.CAP_DSHOW)
+        else:
+            tempCap = cv2.VideoCapture(index)
+        try:
+            # grab() checks for a frame without decoding it
+            if not tempCap.grab():
+                return None
+            return str(index) + ': ' \
+                + str(tempCap.get(cv2.CAP_PROP_FRAME_WIDTH)) \
+                + 'x' + str(tempCap.get(cv2.CAP_PROP_FRAME_HEIGHT)) + ' @ ' \
+                + str(tempCap.get(cv2.CAP_PROP_FPS)) + 'fps'
+        finally:
+            tempCap.release()
+
     def sendUserParameters(self):
         _tempSrc = self.camera_combo.currentText()
         _tempSrc = _tempSrc[:_tempSrc.find(':')]
@@ -468,25 +414,38 @@ class OverlayLabel(QLabel):
     def __init__(self):
         super(OverlayLabel, self).__init__()
         self.display_text = 'Welcome to TAMV. Enter your printer address and click \"Connect..\" to start.'
+        self._overlay_pix = None
 
     def paintEvent(self, event):
         super(OverlayLabel, self).paintEvent(event)
-        pos = QPoint(10, 470)
+        # status bar is only re-rendered when its text changes
+        if self._overlay_pix is None:
+            self._overlay_pix = self.renderOverlay()
         painter = QPainter(self)
+        painter.drawPixmap(0, 450, self._overlay_pix)
+
+    def renderOverlay(self):
+        pixmap = QPixmap(640, 50)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
         painter.setBrush(QColor(204,204,204,230))
         painter.setPen(QColor(255, 255, 255,0))
-        painter.drawRect(0,450,640,50)
+        painter.drawRect(0,0,640,50)
         painter.setPen(QColor(0, 0, 0))
-        painter.drawText(pos, self.display_text)
+        painter.drawText(QPoint(10, 20), self.display_text)
+        painter.end()
+        return pixmap
     
     def setText(self, textToDisplay):
-        self.display_text = textToDisplay
+        if textToDisplay != self.display_text:
+            self.display_text = textToDisplay
+            self._overlay_pix = None
 
 class CalibrateNozzles(QThread):
     # Signals
     status_update = pyqtSignal(str)
     message_update = pyqtSignal(str)
-    change_pixmap_signal = pyqtSignal(np.ndarray)
+    change_pixmap_signal = pyqtSignal(int)
     calibration_complete = pyqtSignal()
     detection_error = pyqtSignal(str)
     result_update = pyqtSignal(object)
@@ -496,10 +455,21 @@ class CalibrateNozzles(QThread):
     display_crosshair = False
     detection_on = False
 
+    # camera properties adjustable through setProperty
+    _PROP_MAP = {
+        'brightness': cv2.CAP_PROP_BRIGHTNESS,
+        'contrast': cv2.CAP_PROP_CONTRAST,
+        'saturation': cv2.CAP_PROP_SATURATION,
+        'hue': cv2.CAP_PROP_HUE
+    }
+
     def __init__(self, parent=None, th1=1, th2=50, thstep=1, minArea=default_minArea, minCircularity=default_minCircularity,numTools=0,cycles=1, align=False):
         super(QThread,self).__init__(parent=parent)
         # transformation matrix
         self.transform_matrix = []
+        # term vector and offsets buffer for calibration moves
+        self.v = np.zeros(6, dtype=np.float64)
+        self._offsets_buf = np.empty(2, dtype=np.float64)
         self.xray = False
         self.loose = False
         self.invert = False
@@ -508,7 +478,27 @@ class CalibrateNozzles(QThread):
         self.detect_th2 = th2
         self.detect_thstep = thstep
         self.detect_minArea = minArea
+        self.detect_maxArea = default_maxArea
         self.detect_minCircularity = minCircularity
+        # parameters the current detector was built with
+        self._params_sig = None
+        # wait condition used to sleep instead of spinning when there is nothing to do
+        self._mutex = QMutex()
+        self._cond = QWaitCondition()
+        # use HoughCircles gradient voting instead of SimpleBlobDetector (opt-in, settings.json 'hough')
+        self.use_hough = use_hough
+        # preprocess on CUDA when OpenCV was built with it (e.g. Jetson), filters are created on first use
+        self.use_cuda = cv2.cuda.getCudaEnabledDeviceCount() > 0
+        self.cuda_lut = None
+        # run the threshold chain and HoughCircles through the OpenCL (T-API) backend when a device is available
+        self.use_opencl = cv2.ocl.haveOpenCL()
+        cv2.ocl.setUseOpenCL(self.use_opencl)
+        # region of interest around last detected nozzle: twice its radius plus padding (pixels)
+        self.roi_padding = 20
+        # plus one calibration move (0.5mm) in pixels, a fixed guess until mpp has been measured
+        self.roi_travel = 50
+        self.last_center = None
+        self.last_radius = 0
         self.numTools = numTools
         self.cycles = cycles
         self.alignment = align
@@ -528,30 +518,56 @@ class CalibrateNozzles(QThread):
         self.saturation = -1
         self.hue = -1
 
+        # capture settings, cached from the global user parameters
+        self.video_src = video_src
+        self.use_gstreamer = use_gstreamer
+        self.camera_width = camera_width
+        self.camera_height = camera_height
+        # alignment overlay geometry, fixed by the camera resolution
+        self.overlay_center = ( int(self.camera_width/2), int(self.camera_height/2) )
+        self.overlay_thickness = int( self.camera_width/1.75 )
+        self.overlay_arm = int( self.camera_width/3 )
+        # pre-rendered overlay (shape, template, mask, roi) and the buffer it is blended into
+        self._overlay_template = None
+        self.overlay_buf = None
+        # persistent capture buffer
+        self.frame_buf = np.empty((self.camera_height, self.camera_width, 3), dtype=np.uint8)
+        # ring of display buffers shared with the GUI thread, only the slot index is signalled
+        self.ring = [np.empty((display_height, display_width, 3), dtype=np.uint8) for i in range(3)]
+        self.ring_idx = 0
+        # gamma corrected frame and BGR preview of the thresholded image
+        self.gamma_buf = np.empty((self.camera_height, self.camera_width, 3), dtype=np.uint8)
+        self.display_buf = np.empty((self.camera_height, self.camera_width, 3), dtype=np.uint8)
+        # single channel buffers for the detection path
+        self.gray_buf = np.empty((self.camera_height, self.camera_width), dtype=np.uint8)
+        self.blur_buf = np.empty((self.camera_height, self.camera_width), dtype=np.uint8)
+        self.mean_buf = np.empty((self.camera_height, self.camera_width), dtype=np.uint8)
+        # float copies for the threshold mean, adaptiveThreshold blurs at float precision before rounding
+        self.blur_f32_buf = np.empty((self.camera_height, self.camera_width), dtype=np.float32)
+        self.mean_f32_buf = np.empty((self.camera_height, self.camera_width), dtype=np.float32)
+        self.binary_buf = np.empty((self.camera_height, self.camera_width), dtype=np.uint8)
+        # gamma lookup tables, keyed on gamma
+        self._gamma_tables = {}
+        # detection gamma, its table is built up front so the first frame doesn't pay for it
+        self.gamma = 1.2
+        self.gammaTable(self.gamma)
+        # buffered frames dropped without decoding before each analyzed frame
+        self.stale_frames = 1
+        # consecutive failed reads before the capture is reopened
+        self.fail_limit = 5
+        self._fail_count = 0
+
         # Start Video feed
-        self.cap = cv2.VideoCapture(video_src)
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, camera_width)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, camera_height)
-        self.cap.set(cv2.CAP_PROP_BUFFERSIZE,1)
-        #self.cap.set(cv2.CAP_PROP_FPS,25)
+        self.cap = cv2.VideoCapture()
+        self.openCapture()
         self.brightness_default = self.cap.get(cv2.CAP_PROP_BRIGHTNESS)
         self.contrast_default = self.cap.get(cv2.CAP_PROP_CONTRAST)
         self.saturation_default = self.cap.get(cv2.CAP_PROP_SATURATION)
         self.hue_default = self.cap.get(cv2.CAP_PROP_HUE)
 
-        self.ret, self.cv_img = self.cap.read()
+        self.ret, frame = self.readFrame()
         if self.ret:
-            local_img = self.cv_img
-            self.change_pixmap_signal.emit(local_img)
-        else:
-            self.cap.open(video_src)
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, camera_width)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, camera_height)
-            self.cap.set(cv2.CAP_PROP_BUFFERSIZE,1)
-            #self.cap.set(cv2.CAP_PROP_FPS,25)
-            self.ret, self.cv_img = self.cap.read()
-            local_img = self.cv_img
-            self.change_pixmap_signal.emit(local_img)
+            self.emitFrame(frame)
 
     def toggleXray(self):
         if self.xray:
@@ -559,41 +575,33 @@ class CalibrateNozzles(QThread):
         else: self.xray = True
 
     def toggleLoose(self):
-        self.detector_changed = True
+        self.setLoose(not self.loose)
+
+    def setLoose(self, loose):
+        # only a real transition changes the detector parameters
+        if loose == self.loose:
+            return
+        self.loose = loose
         if self.loose:
-            self.loose = False
-        else: self.loose = True
+            self.detect_minCircularity = 0.6
+        else: self.detect_minCircularity = default_minCircularity
+        self.detector_changed = True
         
     def toggleInvert(self):
         if self.invert:
             self.invert = False
         else: self.invert = True
         
-    def setProperty(self,brightness=-1, contrast=-1, saturation=-1, hue=-1):
-        try:
-            if int(brightness) >= 0:
-                self.brightness = brightness
-                self.cap.set(cv2.CAP_PROP_BRIGHTNESS,self.brightness)
-        except Exception as b1: 
-            print('Brightness exception: ', b1 )
-        try:
-            if int(contrast) >= 0:
-                self.contrast = contrast
-                self.cap.set(cv2.CAP_PROP_CONTRAST,self.contrast)
-        except Exception as c1:
-            print('Contrast exception: ', c1 )
-        try:
-            if int(saturation) >= 0:
-                self.saturation = saturation
-                self.cap.set(cv2.CAP_PROP_SATURATION,self.saturation)
-        except Exception as s1:
-            print('Saturation exception: ', s1 )
-        try:
-            if int(hue) >= 0:
-                self.hue = hue
-                self.cap.set(cv2.CAP_PROP_HUE,self.hue)
-        except Exception as h1:
-            print('Hue exception: ', h1 )
+    def setProperty(self, **kwargs):
+        for name, value in kwargs.items():
+            try:
+                if value is None or int(value) < 0:
+                    continue
+            except (TypeError, ValueError) as e:
+                print(name.capitalize() + ' exception: ', e)
+                continue
+            setattr(self, name, value)
+            self.cap.set(self._PROP_MAP[name], value)
 
     def getProperties(self):
         return (self.brightness_default, self.contrast_default, self.saturation_default,self.hue_default)
@@ -603,64 +611,51 @@ class CalibrateNozzles(QThread):
 
     def run(self):
         self.createDetector()
-        while True:
+        while not self.isInterruptionRequested():
             if self.detection_on:
                 if self.alignment:
                     try:
-                        if self.loose:
-                            self.detect_minCircularity = 0.6
-                        else: self.detect_minCircularity = default_minCircularity
-                        if self.detector_changed:
-                            self.createDetector()
-                            self.detector_changed = False
+                        self.refreshDetector()
                         self._running = True
+                        # read every tool's G10 offset once, then track the offsets applied below locally
+                        try:
+                            self.g10_offsets = self.parent().printer.getToolOffsets()
+                        except Exception as e1:
+                            print('Batched tool offset request failed: ', e1)
+                            self.g10_offsets = [self.parent().printer.getG10ToolOffset(i) for i in range(self.parent().num_tools)]
                         while self._running:
                             self.cycles = self.parent().cycles
                             for rep in range(self.cycles):
                                 for tool in range(self.parent().num_tools):
-                                    # process GUI events
-                                    app.processEvents()
                                     # Update status bar
                                     self.status_update.emit('Calibrating T' + str(tool) + ', cycle: ' + str(rep+1) + '/' + str(self.cycles))
-                                    # Load next tool for calibration
-                                    self.parent().printer.gCode('T'+str(tool))
-                                    # Move tool to CP coordinates
-                                    self.parent().printer.gCode('G1 X' + str(self.parent().cp_coords['X']))
-                                    self.parent().printer.gCode('G1 Y' + str(self.parent().cp_coords['Y']))
-                                    self.parent().printer.gCode('G1 Z' + str(self.parent().cp_coords['Z']))
+                                    # Load next tool for calibration and move it to CP coordinates in a single request
+                                    cp = self.parent().cp_coords
+                                    self.parent().printer.gCode(f"T{tool}\nG1 X{cp['X']} Y{cp['Y']} Z{cp['Z']}")
                                     # Wait for moves to complete
-                                    while self.parent().printer.getStatus() not in 'idle':
-                                        # process GUI events
-                                        app.processEvents()
-                                        self.ret, self.cv_img = self.cap.read()
+                                    self.last_status_check = 0
+                                    while not self.isInterruptionRequested():
+                                        # rate-limit status polling, the camera frame rate throttles the loop
+                                        now = time.monotonic_ns()
+                                        if now - self.last_status_check > 100000000:
+                                            self.last_status_check = now
+                                            if self.parent().printer.getStatus() in 'idle':
+                                                break
+                                        self.ret, frame = self.readFrame()
                                         if self.ret:
-                                            local_img = self.cv_img
-                                            self.change_pixmap_signal.emit(local_img)
+                                            self.emitFrame(frame)
                                         else:
-                                            self.cap.open(video_src)
-                                            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, camera_width)
-                                            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, camera_height)
-                                            self.cap.set(cv2.CAP_PROP_BUFFERSIZE,1)
-                                            #self.cap.set(cv2.CAP_PROP_FPS,25)
-                                            self.ret, self.cv_img = self.cap.read()
-                                            local_img = self.cv_img
-                                            self.change_pixmap_signal.emit(local_img)
-                                            continue
+                                            # yield instead of spinning on a camera that isn't delivering
+                                            self.idleWait(10)
                                     # Update message bar
                                     self.message_update.emit('Searching for nozzle..')
                                     # Process runtime algorithm changes
-                                    if self.loose:
-                                        self.detect_minCircularity = 0.6
-                                    else: self.detect_minCircularity = default_minCircularity
-                                    if self.detector_changed:
-                                        self.createDetector()
-                                        self.detector_changed = False
+                                    self.refreshDetector()
                                     # Analyze frame for blobs
                                     (c, transform, mpp) = self.calibrateTool(tool, rep)
-                                    # process GUI events
-                                    app.processEvents()
                                     # apply offsets to machine
                                     self.parent().printer.gCode( 'G10 P' + str(tool) + ' X' + str(c['X']) + ' Y' + str(c['Y']) )
+                                    self.g10_offsets[tool] = {'X': c['X'], 'Y': c['Y']}
                             # signal end of execution
                             self._running = False
                         # Update status bar
@@ -668,10 +663,8 @@ class CalibrateNozzles(QThread):
                         # HBHBHB
                         # Update debug window with results
                         # self.parent().debugString += '\nCalibration output:\n'
-                        self.parent().printer.gCode('T-1')
-                        self.parent().printer.gCode('G1 X' + str(self.parent().cp_coords['X']))
-                        self.parent().printer.gCode('G1 Y' + str(self.parent().cp_coords['Y']))
-                        self.parent().printer.gCode('G1 Z' + str(self.parent().cp_coords['Z']))
+                        cp = self.parent().cp_coords
+                        self.parent().printer.gCode(f"T-1\nG1 X{cp['X']} Y{cp['Y']} Z{cp['Z']}")
                         self.status_update.emit('Calibration complete: Done.')
                         self.alignment = False
                         self.detection_on = False
@@ -688,69 +681,109 @@ class CalibrateNozzles(QThread):
                 else:
                     # don't run alignment - fetch frames and detect only
                     try:
-                        if self.loose:
-                            self.detect_minCircularity = 0.6
-                        else: self.detect_minCircularity = default_minCircularity
+                        self.refreshDetector()
                         self._running = True
                         # transformation matrix
                         #self.transform_matrix = []
-                        while self._running and self.detection_on:
+                        while self._running and self.detection_on and not self.isInterruptionRequested():
                             # Update status bar
                             #self.status_update.emit('Detection mode: ON')
                             # Process runtime algorithm changes
-                            if self.loose:
-                                self.detect_minCircularity = 0.6
-                            else: self.detect_minCircularity = default_minCircularity
-                            if self.detector_changed:
-                                self.createDetector()
-                                self.detector_changed = False
+                            self.refreshDetector()
                             # Run detection and update output
                             self.analyzeFrame()
-                            # process GUI events
-                            app.processEvents()
                     except Exception as mn1:
                         self._running = False
                         self.detection_error.emit(str(mn1))
                         self.cap.release()
             else:
-                while not self.detection_on:
+                while not self.detection_on and not self.isInterruptionRequested():
                     try:
-                        self.ret, self.cv_img = self.cap.read()
+                        self.ret, frame = self.readFrame()
                         if self.ret:
-                            local_img = self.cv_img
-                            self.change_pixmap_signal.emit(local_img)
+                            self.emitFrame(frame)
                         else:
-                            # reset capture
-                            self.cap.open(video_src)
-                            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, camera_width)
-                            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, camera_height)
-                            self.cap.set(cv2.CAP_PROP_BUFFERSIZE,1)
-                            #self.cap.set(cv2.CAP_PROP_FPS,25)
-                            self.ret, self.cv_img = self.cap.read()
-                            if self.ret:
-                                local_img = self.cv_img
-                                self.change_pixmap_signal.emit(local_img)
+                            # camera unavailable: sleep until woken or timed out instead of spinning
+                            self.idleWait()
                             continue
-                        app.processEvents()
                     except Exception as mn2:
-                        self.status_update( 'Error: ' + str(mn2) )
+                        self.status_update.emit( 'Error: ' + str(mn2) )
                         print('Error: ' + str(mn2))
                         self.cap.release()
                         self.detection_on = False
                         self._running = False
-                        exit()
-                    app.processEvents()
-                app.processEvents()
-                continue
+                        return
         self.cap.release()
 
+    def thresholdFrame(self, frame):
+        # Detection algorithm 1:
+        #    gamma correction -> luma (grayscale) -> GaussianBlur (7,7),6 -> adaptive threshold
+        gammaInput = self.gamma
+        if self.use_cuda:
+            blurred = self.cudaBlur(frame, gammaInput)
+        elif self.use_opencl:
+            # run the whole chain on the OpenCL device, downloading only the two results
+            u_frame = self.adjust_gamma(image=cv2.UMat(frame), gamma=gammaInput)
+            u_gray = cv2.cvtColor(u_frame, cv2.COLOR_BGR2GRAY)
+            u_blurred = cv2.GaussianBlur(u_gray,(7,7),6)
+            u_blurred_f32 = cv2.multiply(u_blurred, 1.0, dtype=cv2.CV_32F)
+            u_mean = cv2.convertScaleAbs(cv2.GaussianBlur(u_blurred_f32,(35,35),0, borderType=cv2.BORDER_REPLICATE|cv2.BORDER_ISOLATED))
+            u_binary = cv2.compare(u_blurred, u_mean, self.thresholdCompare())
+            return (u_blurred.get(), u_binary.get())
+        else:
+            frame = self.adjust_gamma(image=frame, gamma=gammaInput, dst=self.gamma_buf)
+            # detection only needs luma: BGR2GRAY uses the same BT.601 weights as the YUV Y plane
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self.gray_buf)
+            # keep blurred luma for circle detection (HoughCircles votes along edge gradients)
+            blurred = cv2.GaussianBlur(gray,(7,7),6, dst=self.blur_buf)
+        # adaptive threshold (gaussian, 35x35, C=1) specialized: like adaptiveThreshold the mean is blurred in float
+        # and rounded to uint8, and for integer pixels src > mean-1 is src >= mean, so one compare gives the same mask
+        # while the float and mean images live in reused buffers instead of being allocated per frame
+        blurred_f32 = cv2.multiply(blurred, 1.0, dst=self.blur_f32_buf, dtype=cv2.CV_32F)
+        mean_f32 = cv2.GaussianBlur(blurred_f32,(35,35),0, dst=self.mean_f32_buf, borderType=cv2.BORDER_REPLICATE|cv2.BORDER_ISOLATED)
+        mean = cv2.convertScaleAbs(mean_f32, dst=self.mean_buf)
+        binary = cv2.compare(blurred, mean, self.thresholdCompare(), dst=self.binary_buf)
+        return (blurred, binary)
+
+    def thresholdCompare(self):
+        # inverting the mask is the same as flipping the comparison, so invert costs no extra pass
+        if self.invert:
+            return cv2.CMP_LT
+        return cv2.CMP_GE
+
+    def cudaBlur(self, frame, gamma):
+        # gamma, luma and the 7x7 blur on the GPU, only the single channel result is downloaded
+        # (the 35x35 threshold mean exceeds the CUDA filter kernel size limit and stays on the CPU)
+        if self.cuda_lut is None:
+            self.cuda_lut = cv2.cuda.createLookUpTable(self.gammaTable(gamma).reshape(1, 256))
+            self.cuda_blur = cv2.cuda.createGaussianFilter(cv2.CV_8UC1, cv2.CV_8UC1, (7,7), 6)
+            self.gpu_frame = cv2.cuda_GpuMat()
+        self.gpu_frame.upload(frame)
+        gpu_gray = cv2.cuda.cvtColor(self.cuda_lut.transform(self.gpu_frame), cv2.COLOR_BGR2GRAY)
+        return self.cuda_blur.apply(gpu_gray).download(dst=self.blur_buf)
+
+    def idleWait(self, timeout=100):
+        self._mutex.lock()
+        self._cond.wait(self._mutex, timeout)
+        self._mutex.unlock()
+
+    def wake(self):
+        # wake the thread after a state change (detection/calibration started or stopped)
+        self._cond.wakeAll()
+
+    def setDetection(self, on):
+        # crosshair follows detection, then wake the loop to pick up the new state
+        self.display_crosshair = on
+        self.detection_on = on
+        self.wake()
+
     def analyzeFrame(self):
         # Placeholder coordinates
         xy = [0,0]
         # Counter of frames with no circle.
         nocircle = 0
         # Random time offset
-        rd = int(round(time.time()*1000))
+        rd = time.perf_counter_ns()
         # reset capture
         #self.cap.open(video_src)
         #self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, camera_width)
@@ -758,16 +791,11 @@ class CalibrateNozzles(QThread):
         #self.cap.set(cv2.CAP_PROP_BUFFERSIZE,1)
         #self.cap.set(cv2.CAP_PROP_FPS,25)
 
-        while True and self.detection_on:
-            app.processEvents()
-            self.ret, self.frame = self.cap.read()
+        while self.detection_on and not self.isInterruptionRequested():
+            # skip frames buffered while the previous one was analyzed, only the newest is decoded
+            self.ret, self.frame = self.readFrame(stale=self.stale_frames)
             if not self.ret:
-                # reset capture
-                self.cap.open(video_src)
-                self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, camera_width)
-                self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, camera_height)
-                self.cap.set(cv2.CAP_PROP_BUFFERSIZE,1)
-                #self.cap.set(cv2.CAP_PROP_FPS,25)
+                self.idleWait(10)
                 continue
             if self.alignment:
                 try:
@@ -778,78 +806,60 @@ class CalibrateNozzles(QThread):
             # capture first clean frame for display
             cleanFrame = self.frame
             # apply nozzle detection algorithm
-            # Detection algorithm 1:
-            #    gamma correction -> use Y channel from YUV -> GaussianBlur (7,7),6 -> adaptive threshold
-            gammaInput = 1.2
-            self.frame = self.adjust_gamma(image=self.frame, gamma=gammaInput)
-            yuv = cv2.cvtColor(self.frame, cv2.COLOR_BGR2YUV)
-            yuvPlanes = cv2.split(yuv)
-            yuvPlanes[0] = cv2.GaussianBlur(yuvPlanes[0],(7,7),6)
-            yuvPlanes[0] = cv2.adaptiveThreshold(yuvPlanes[0],255,cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY,35,1)
-            self.frame = cv2.cvtColor(yuvPlanes[0],cv2.COLOR_GRAY2BGR)
-
-            target = [int(np.around(self.frame.shape[1]/2)),int(np.around(self.frame.shape[0]/2))]
+            (blurred, binary) = self.thresholdFrame(self.frame)
+
+            target = [int(np.around(binary.shape[1]/2)),int(np.around(binary.shape[0]/2))]
             # Process runtime algorithm changes
-            if self.loose:
-                self.detect_minCircularity = 0.6
-            else: self.detect_minCircularity = default_minCircularity
-            if self.detector_changed:
-                self.createDetector()
-                self.detector_changed = False
+            self.refreshDetector()
             # draw the timestamp on the frame AFTER the circle detector! Otherwise it finds the circles in the numbers.
-            if self.xray:
-                cleanFrame = self.frame
+            # only the xray/invert previews show the thresholded image, convert it back to BGR for coloured overlays
+            if self.xray or self.invert:
+                cleanFrame = cv2.cvtColor(binary,cv2.COLOR_GRAY2BGR, dst=self.display_buf)
             # run nozzle detection for keypoints
-            if self.invert:
-                cleanFrame = cv2.bitwise_not(self.frame)
-                self.frame = cv2.bitwise_not(self.frame)
-                keypoints = self.detector.detect(cleanFrame)
+            if self.use_hough:
+                keypoints = self.roiDetect(self.houghDetect, blurred)
             else:
-                keypoints = self.detector.detect(self.frame)
+                keypoints = self.roiDetect(self.detector.detect, binary)
             # check if we are displaying a crosshair
             if self.display_crosshair:
                 self.frame = cv2.line(cleanFrame, (target[0],    target[1]-25), (target[0],    target[1]+25), (0, 255, 0), 1)
                 self.frame = cv2.line(self.frame, (target[0]-25, target[1]   ), (target[0]+25, target[1]   ), (0, 255, 0), 1)
             else: self.frame = cleanFrame
-            # update image
-            local_img = self.frame
-            self.change_pixmap_signal.emit(local_img)
+            # each branch below emits the finished frame exactly once
             if(nocircle> 25):
                 self.message_update.emit( 'Error in detecting nozzle.' )
                 nocircle = 0
+                self.emitFrame(self.frame)
                 continue
             num_keypoints=len(keypoints)
             if (num_keypoints == 0):
-                if (25 < (int(round(time.time() * 1000)) - rd)):
+                if (25000000 < (time.perf_counter_ns() - rd)):
                     nocircle += 1
                     self.frame = self.putText(self.frame,'No circles found',offsety=3)
                     self.message_update.emit( 'No circles found.' )
-                    local_img = self.frame
-                    self.change_pixmap_signal.emit(local_img)
+                self.emitFrame(self.frame)
                 continue
             if (num_keypoints > 1):
-                if (25 < (int(round(time.time() * 1000)) - rd)):
+                if (25000000 < (time.perf_counter_ns() - rd)):
                     self.message_update.emit( 'Too many circles found. Please stop and clean the nozzle.' )
                     self.frame = self.putText(self.frame,'Too many circles found '+str(num_keypoints),offsety=3, color=(255,255,255))
-                    self.frame = cv2.drawKeypoints(self.frame, keypoints, np.array([]), (255,255,255), cv2.DRAW_MATCHES_FLAGS_DRAW_RICH_KEYPOINTS)
-                    local_img = self.frame
-                    self.change_pixmap_signal.emit(local_img)
+                    self.frame = cv2.drawKeypoints(self.frame, keypoints, self.frame, (255,255,255), cv2.DRAW_MATCHES_FLAGS_DRAW_RICH_KEYPOINTS | cv2.DRAW_MATCHES_FLAGS_DRAW_OVER_OUTIMG)
+                self.emitFrame(self.frame)
                 continue
             # Found one and only one circle.  Put it on the frame.
             nocircle = 0 
             xy = np.around(keypoints[0].pt)
             r = np.around(keypoints[0].size/2)
             # draw the blobs that look circular
-            self.frame = cv2.drawKeypoints(self.frame, keypoints, np.array([]), (0,0,255), cv2.DRAW_MATCHES_FLAGS_DRAW_RICH_KEYPOINTS)
+            self.frame = cv2.drawKeypoints(self.frame, keypoints, self.frame, (0,0,255), cv2.DRAW_MATCHES_FLAGS_DRAW_RICH_KEYPOINTS | cv2.DRAW_MATCHES_FLAGS_DRAW_OVER_OUTIMG)
             # Note its radius and position
             ts =  'U{0:3.0f} V{1:3.0f} R{2:2.0f}'.format(xy[0],xy[1],r)
             xy = np.uint16(xy)
             #self.frame = self.putText(self.frame, ts, offsety=2, color=(0, 255, 0), stroke=2)
             self.message_update.emit(ts)
             # show the frame
-            local_img = self.frame
-            self.change_pixmap_signal.emit(local_img)
-            rd = int(round(time.time() * 1000))
+            self.emitFrame(self.frame)
+            rd = time.perf_counter_ns()
             #end the loop
             break
         # and tell our parent.
@@ -859,8 +869,11 @@ class CalibrateNozzles(QThread):
             return
 
     def calibrateTool(self, tool, rep):
+        # bind the main window and printer once, self.parent() is a call into Qt
+        parent = self.parent()
+        printer = parent.printer
         # timestamp for caluclating tool calibration runtime
-        self.startTime = time.time()
+        self.startTime = time.perf_counter()
         # average location of keypoints in frame
         self.average_location=[0,0]
         # current location
@@ -875,10 +888,17 @@ class CalibrateNozzles(QThread):
         self.state = 0
         # detected blob counter
         self.detect_count = 0
+        # first detection for each tool searches the full frame
+        self.last_center = None
+        self.last_radius = 0
         # Save CP coordinates to local class
-        self.cp_coordinates = self.parent().cp_coords
+        self.cp_coordinates = parent.cp_coords
         # number of average position loops
         self.position_iterations = 5
+        # detections averaged for each position
+        self.samples = np.empty((self.position_iterations, 2), dtype=np.float64)
+        # machine coordinates read with each detection, averaged alongside the pixel positions
+        self.coord_samples = np.empty((self.position_iterations, 2), dtype=np.float64)
         # calibration move set (0.5mm radius circle over 10 moves)
         self.calibrationCoordinates = [ [0,-0.5], [0.294,-0.405], [0.476,-0.155], [0.476,0.155], [0.294,0.405], [0,0.5], [-0.294,0.405], [-0.476,0.155], [-0.476,-0.155], [-0.294,-0.405] ]
 
@@ -886,7 +906,7 @@ class CalibrateNozzles(QThread):
         if len(self.transform_matrix) > 1:
             # set state flag to Step 2: nozzle alignment stage
             self.state = 200
-            self.parent().debugString += '\nCalibrating T'+str(tool)+':C'+str(rep)+': '
+            parent.debugString += '\nCalibrating T'+str(tool)+':C'+str(rep)+': '
         
         # Space coordinates
         self.space_coordinates = []
@@ -894,26 +914,34 @@ class CalibrateNozzles(QThread):
         self.calibration_moves = 0
 
         while True:
+            # start every batch of samples only once the last move has finished, frames from a moving carriage would skew the average
+            if self.detect_count == 0:
+                self.waitForMove(printer)
             (self.xy, self.target, self.tool_coordinates, self.radius) = self.analyzeFrame()
+            # a detection without machine coordinates can't be paired, take another sample
+            if self.tool_coordinates is None:
+                continue
             # analyzeFrame has returned our target coordinates, average its location and process according to state
-            self.average_location[0] += self.xy[0]
-            self.average_location[1] += self.xy[1]
-            
+            self.samples[self.detect_count] = self.xy
+            self.coord_samples[self.detect_count] = (self.tool_coordinates['X'], self.tool_coordinates['Y'])
             self.detect_count += 1
 
             # check if we've reached our number of detections for average positioning
             if self.detect_count >= self.position_iterations:
-                # calculate average X Y position from detection
-                self.average_location[0] /= self.detect_count
-                self.average_location[1] /= self.detect_count
-                # round to 3 decimal places
-                self.average_location = np.around(self.average_location,3)
-                # get another detection validated
-                (self.xy, self.target, self.tool_coordinates, self.radius) = self.analyzeFrame()
+                self.detect_count = 0
+                # the carriage must not have moved while the batch was sampled, otherwise sample the position again
+                if np.ptp(self.coord_samples, axis=0).max() > 0.001:
+                    continue
+                # calculate average X Y position from detection, rounded to 3 decimal places
+                self.average_location = np.around(self.samples.mean(axis=0),3)
+                self.xy = self.average_location
+                # pair the averaged pixel position with the averaged machine position
+                coords = self.coord_samples.mean(axis=0)
+                self.tool_coordinates = {'X': np.around(coords[0],3), 'Y': np.around(coords[1],3)}
                 
                 #### Step 1: camera calibration and transformation matrix calculation
                 if self.state == 0:
-                    self.parent().debugString += 'Calibrating camera...\n'
+                    parent.debugString += 'Calibrating camera...\n'
                     # Update GUI thread with current status and percentage complete
                     self.status_update.emit('Calibrating camera..')
                     self.message_update.emit('Calibrating rotation.. (10%)')
@@ -929,7 +957,7 @@ class CalibrateNozzles(QThread):
                     # move carriage for calibration
                     self.offsetX = self.calibrationCoordinates[0][0]
                     self.offsetY = self.calibrationCoordinates[0][1]
-                    self.parent().printer.gCode('G91 G1 X' + str(self.offsetX) + ' Y' + str(self.offsetY) +' F3000 G90 ')
+                    printer.gCode('G91 G1 X' + str(self.offsetX) + ' Y' + str(self.offsetY) +' F3000 G90 ')
                     # Update state tracker to second nozzle calibration move
                     self.state = 1
                     continue
@@ -941,6 +969,7 @@ class CalibrateNozzles(QThread):
                     # check if we've already moved, and calculate mpp value
                     if self.state == 1:
                         self.mpp = np.around(0.5/self.getDistance(self.oldxy[0],self.oldxy[1],self.xy[0],self.xy[1]),4)
+                        self.roi_travel = max(self.roi_padding, int(np.ceil(0.5/self.mpp)))
                     # save position as previous position
                     self.oldxy = self.xy
                     # save machine coordinates for detected nozzle
@@ -950,19 +979,19 @@ class CalibrateNozzles(QThread):
                     # return carriage to relative center of movement
                     self.offsetX = -1*self.offsetX
                     self.offsetY = -1*self.offsetY
-                    self.parent().printer.gCode('G91 G1 X' + str(self.offsetX) + ' Y' + str(self.offsetY) +' F3000 G90 ')
+                    printer.gCode('G91 G1 X' + str(self.offsetX) + ' Y' + str(self.offsetY) +' F3000 G90 ')
                     # move carriage a random amount in X&Y to collect datapoints for transform matrix
                     self.offsetX = self.calibrationCoordinates[self.state][0]
                     self.offsetY = self.calibrationCoordinates[self.state][1]
-                    self.parent().printer.gCode('G91 G1 X' + str(self.offsetX) + ' Y' + str(self.offsetY) +' F3000 G90 ')
+                    printer.gCode('G91 G1 X' + str(self.offsetX) + ' Y' + str(self.offsetY) +' F3000 G90 ')
                     # increment state tracker to next calibration move
                     self.state += 1
                     continue
                 # check if final calibration move has been completed
                 elif self.state == len(self.calibrationCoordinates):
-                    calibration_time = np.around(time.time() - self.startTime,1)
-                    self.parent().debugString += 'Camera calibration completed in ' + str(calibration_time) + ' seconds.\n'
-                    self.parent().debugString += 'Millimeters per pixel: ' + str(self.mpp) + '\n\n'
+                    calibration_time = np.around(time.perf_counter() - self.startTime,1)
+                    parent.debugString += 'Camera calibration completed in ' + str(calibration_time) + ' seconds.\n'
+                    parent.debugString += 'Millimeters per pixel: ' + str(self.mpp) + '\n\n'
                     print('Millimeters per pixel: ' + str(self.mpp))
                     print('Camera calibration completed in ' + str(calibration_time) + ' seconds.')
                     # Update GUI thread with current status and percentage complete
@@ -981,12 +1010,12 @@ class CalibrateNozzles(QThread):
                     self.newCenter = self.transform_matrix.T @ np.array([0, 0, 0, 0, 0, 1])
                     self.guess_position[0]= np.around(self.newCenter[0],3)
                     self.guess_position[1]= np.around(self.newCenter[1],3)
-                    self.parent().printer.gCode('G90 G1 X{0:-1.3f} Y{1:-1.3f} F1000 G90 '.format(self.guess_position[0],self.guess_position[1]))
+                    printer.gCode('G90 G1 X{0:-1.3f} Y{1:-1.3f} F1000 G90 '.format(self.guess_position[0],self.guess_position[1]))
                     # update state tracker to next phase
                     self.state = 200
                     # start tool calibration timer
-                    self.startTime = time.time()
-                    self.parent().debugString += '\nCalibrating T'+str(tool)+':C'+str(rep)+': '
+                    self.startTime = time.perf_counter()
+                    parent.debugString += '\nCalibrating T'+str(tool)+':C'+str(rep)+': '
                     continue
                 #### Step 2: nozzle alignment stage
                 elif self.state == 200:
@@ -997,21 +1026,28 @@ class CalibrateNozzles(QThread):
                     self.calibration_moves += 1
                     # nozzle detected, frame rotation is set, start
                     self.cx,self.cy = self.normalize_coords(self.xy)
-                    self.v = [self.cx**2, self.cy**2, self.cx*self.cy, self.cx, self.cy, 0]
-                    self.offsets = -1*(0.55*self.transform_matrix.T @ self.v)
+                    # fill the quadratic term vector in place, the constant term stays 0
+                    v = self.v
+                    v[0] = self.cx*self.cx
+                    v[1] = self.cy*self.cy
+                    v[2] = self.cx*self.cy
+                    v[3] = self.cx
+                    v[4] = self.cy
+                    self.offsets = np.dot(self.transform_matrix.T, v, out=self._offsets_buf)
+                    self.offsets *= -0.55
                     self.offsets[0] = np.around(self.offsets[0],3)
                     self.offsets[1] = np.around(self.offsets[1],3)
                     # Move it a bit
-                    self.parent().printer.gCode( 'M564 S1' )
-                    self.parent().printer.gCode( 'G91 G1 X{0:-1.3f} Y{1:-1.3f} F1000 G90 '.format(self.offsets[0],self.offsets[1]) )
+                    printer.gCode( 'M564 S1' )
+                    printer.gCode( 'G91 G1 X{0:-1.3f} Y{1:-1.3f} F1000 G90 '.format(self.offsets[0],self.offsets[1]) )
                     # save position as previous position
                     self.oldxy = self.xy
                     if ( self.offsets[0] == 0.0 and self.offsets[1] == 0.0 ):
-                        self.parent().debugString += str(self.calibration_moves) + ' moves.\n'
-                        self.parent().printer.gCode( 'G1 F13200' )
+                        parent.debugString += str(self.calibration_moves) + ' moves.\n'
+                        printer.gCode( 'G1 F13200' )
                         # Update GUI with progress
                         # calculate final offsets and return results
-                        self.tool_offsets = self.parent().printer.getG10ToolOffset(tool)
+                        self.tool_offsets = self.g10_offsets[tool]
                         final_x = np.around( (self.cp_coordinates['X'] + self.tool_offsets['X']) - self.tool_coordinates['X'], 3 )
                         final_y = np.around( (self.cp_coordinates['Y'] + self.tool_offsets['Y']) - self.tool_coordinates['Y'], 3 )
                         string_final_x = "{:.3f}".format(final_x)
@@ -1022,20 +1058,20 @@ class CalibrateNozzles(QThread):
                         _return['X'] = final_x
                         _return['Y'] = final_y
                         _return['MPP'] = self.mpp
-                        _return['time'] = np.around(time.time() - self.startTime,1)
+                        _return['time'] = np.around(time.perf_counter() - self.startTime,1)
                         self.message_update.emit('Nozzle calibrated: offset coordinates X' + str(_return['X']) + ' Y' + str(_return['Y']) )
-                        self.parent().debugString += 'T' + str(tool) + ', cycle ' + str(rep+1) + ' completed in ' + str(_return['time']) + ' seconds.\n'
+                        parent.debugString += 'T' + str(tool) + ', cycle ' + str(rep+1) + ' completed in ' + str(_return['time']) + ' seconds.\n'
                         print('T' + str(tool) + ', cycle ' + str(rep+1) + ' completed in ' + str(_return['time']) + ' seconds.')
                         self.message_update.emit('T' + str(tool) + ', cycle ' + str(rep+1) + ' completed in ' + str(_return['time']) + ' seconds.')
-                        self.parent().printer.gCode( 'G1 F13200' )
+                        printer.gCode( 'G1 F13200' )
 
-                        self.parent().debugString += 'G10 P' + str(tool) + ' X' + string_final_x + ' Y' + string_final_y + '\n'
+                        parent.debugString += 'G10 P' + str(tool) + ' X' + string_final_x + ' Y' + string_final_y + '\n'
                         x_tableitem = QTableWidgetItem(string_final_x)
                         x_tableitem.setBackground(QColor(100,255,100,255))
                         y_tableitem = QTableWidgetItem(string_final_y)
                         y_tableitem.setBackground(QColor(100,255,100,255))
-                        self.parent().offsets_table.setItem(tool,0,x_tableitem)
-                        self.parent().offsets_table.setItem(tool,1,y_tableitem)
+                        parent.offsets_table.setItem(tool,0,x_tableitem)
+                        parent.offsets_table.setItem(tool,1,y_tableitem)
                         self.result_update.emit({
                             'tool': str(tool),
                             'cycle': str(rep),
@@ -1051,57 +1087,172 @@ class CalibrateNozzles(QThread):
                 self.location = {'X':0,'Y':0}
                 self.count = 0
 
+    def waitForMove(self, printer):
+        # M400 drains the move queue, then poll until the controller reports idle
+        printer.gCode('M400')
+        # the carriage was commanded to move, the nozzle may have left the tracking window
+        self.last_center = None
+        while not self.isInterruptionRequested() and printer.getStatus() not in 'idle':
+            self.idleWait(100)
+
+    def openCapture(self):
+        # (re)open the video source and apply capture settings
+        if self.use_gstreamer and isinstance(self.video_src, int):
+            # decode MJPEG in a GStreamer pipeline (decodebin picks a hardware decoder when present)
+            pipeline = 'v4l2src device=/dev/video' + str(self.video_src) \
+                + ' ! image/jpeg,width=' + str(self.camera_width) + ',height=' + str(self.camera_height) \
+                + ' ! decodebin ! videoconvert ! video/x-raw,format=BGR ! appsink drop=true max-buffers=1 sync=false'
+            if self.cap.open(pipeline, cv2.CAP_GSTREAMER):
+                return
+            print('GStreamer pipeline failed, falling back to default capture backend.')
+        self.cap.open(self.video_src)
+        self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.camera_width)
+        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.camera_height)
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE,1)
+        #self.cap.set(cv2.CAP_PROP_FPS,25)
+
+    def readFrame(self, stale=0):
+        # drop stale frames with grab() (no decode), then decode into the persistent buffer
+        for i in range(stale):
+            self.cap.grab()
+        if not self.cap.grab():
+            self.captureFailed()
+            return (False, None)
+        ret, frame = self.cap.retrieve(self.frame_buf)
+        if ret:
+            self._fail_count = 0
+        else:
+            self.captureFailed()
+        return (ret, frame)
+
+    def captureFailed(self):
+        # transient read errors are retried, the capture is only reopened after repeated failures
+        self._fail_count += 1
+        if self._fail_count < self.fail_limit:
+            return
+        self._fail_count = 0
+        self.openCapture()
+        # reopening resets the camera controls, restore the user's settings
+        self.setProperty(brightness=self.brightness, contrast=self.contrast, saturation=self.saturation, hue=self.hue)
+
+    def emitFrame(self, frame):
+        if frame is None:
+            return
+        if self.parent().crosshair:
+            frame = self.drawAlignmentOverlay(frame)
+        # downscale to the display size before conversion, detection keeps the full frame
+        (h, w) = frame.shape[:2]
+        scale = min(display_width/w, display_height/h)
+        if scale != 1:
+            # area averaging for downscales, it is only run on the frames that are actually shown
+            interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_NEAREST
+            frame = cv2.resize(frame, (int(w*scale), int(h*scale)), interpolation=interpolation)
+        # write into the next ring slot and hand its index to the GUI thread
+        index = self.ring_idx
+        if self.ring[index].shape != frame.shape:
+            self.ring[index] = np.empty(frame.shape, dtype=np.uint8)
+        if qimage_bgr888 is not None:
+            # BGR that Qt can wrap as is: a plain copy, no channel swap
+            np.copyto(self.ring[index], frame)
+        else:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self.ring[index])
+        self.ring_idx = (index + 1) % len(self.ring)
+        self.change_pixmap_signal.emit(index)
+
+    def overlayTemplate(self, shape):
+        # the overlay only depends on the frame shape, render it once with a mask of the drawn pixels
+        if self._overlay_template is None or self._overlay_template[0] != shape:
+            template = np.zeros(shape, dtype=np.uint8)
+            mask = np.zeros(shape[:2], dtype=np.uint8)
+            center = self.overlay_center
+            arm = self.overlay_arm
+            for (target, green, red, black, grey) in ((template, (0,255,0), (0,0,255), (0,0,0), (128,128,128)), (mask, 255, 255, 255, 255)):
+                cv2.circle( target, center, 6, green, self.overlay_thickness )
+                cv2.circle( target, center, 5, red, 2 )
+                for i in range(0,8):
+                    cv2.circle( target, center, 25*i, black, 1 )
+                cv2.line(target, (center[0],center[1]-arm), (center[0],center[1]+arm), grey, 1)
+                cv2.line(target, (center[0]-arm,center[1]), (center[0]+arm,center[1]), grey, 1)
+            # blend only the bounding box of the drawn pixels
+            (x, y, w, h) = cv2.boundingRect(mask)
+            roi = (slice(y, y+h), slice(x, x+w))
+            mask = mask[roi] > 0
+            if template.ndim == 3:
+                mask = mask[..., None]
+            self._overlay_template = (shape, template[roi].copy(), mask, roi)
+        return self._overlay_template[1:]
+
+    def drawAlignmentOverlay(self, cv_img):
+        # Draw alignment circle on image
+        alpha = 0.5
+        beta = 1-alpha
+        (template, mask, roi) = self.overlayTemplate(cv_img.shape)
+        if self.overlay_buf is None or self.overlay_buf.shape != cv_img.shape:
+            self.overlay_buf = np.empty_like(cv_img)
+        np.copyto(self.overlay_buf, cv_img)
+        # pixels outside the drawn shapes blend with themselves, so only the masked ones change
+        region = self.overlay_buf[roi]
+        blend = cv2.addWeighted(template, beta, region, alpha, 0)
+        np.copyto(region, blend, where=mask)
+        return self.overlay_buf
+
     def normalize_coords(self,coords):
-        xdim, ydim = camera_width, camera_height
+        xdim, ydim = self.camera_width, self.camera_height
         return (coords[0] / xdim - 0.5, coords[1] / ydim - 0.5)
 
     def least_square_mapping(self,calibration_points):
         # Compute a 2x2 map from displacement vectors in screen space to real space.
-        n = len(calibration_points)
-        real_coords, pixel_coords = np.empty((n,2)),np.empty((n,2))
-        for i, (r,p) in enumerate(calibration_points):
-            real_coords[i] = r
-            pixel_coords[i] = p
+        real_coords = np.asarray([r for r, p in calibration_points], dtype=np.float64)
+        pixel_coords = np.asarray([p for r, p in calibration_points], dtype=np.float64)
         x,y = pixel_coords[:,0],pixel_coords[:,1]
-        A = np.vstack([x**2,y**2,x * y, x,y,np.ones(n)]).T
+        A = np.column_stack((x*x, y*y, x*y, x, y, np.ones_like(x)))
         transform = np.linalg.lstsq(A, real_coords, rcond = None)
         return transform[0], transform[1].mean()
 
     def getDistance(self, x1, y1, x0, y0 ):
-        x1_float = float(x1)
-        x0_float = float(x0)
-        y1_float = float(y1)
-        y0_float = float(y0)
-        x_dist = (x1_float - x0_float) ** 2
-        y_dist = (y1_float - y0_float) ** 2
-        retVal = np.sqrt((x_dist + y_dist))
-        return np.around(retVal,3)
+        return round(math.hypot(float(x1) - float(x0), float(y1) - float(y0)), 3)
 
     def stop(self):
         self._running = False
         self.detection_on = False
+        self.requestInterruption()
+        self.wake()
         try:
             tempCoords = self.printer.getCoords()
             if self.printer.isIdle():
-                self.parent().printer.gCode('T-1')
-                self.parent().printer.gCode('G1 X' + str(tempCoords['X']) + ' Y' + str(tempCoords['Y']))
+                self.parent().printer.gCode(f"T-1\nG1 X{tempCoords['X']} Y{tempCoords['Y']}")
                 while self.parent().printer.getStatus() not in 'idle':
                     time.sleep(1)
         except: None
         self.cap.release()
         self.exit()
 
+    def refreshDetector(self):
+        # Process runtime algorithm changes, only rebuilding the detector when its parameters changed
+        if self.detectorSignature() != self._params_sig:
+            self.createDetector()
+        self.detector_changed = False
+
+    def detectorSignature(self):
+        return (self.detect_minCircularity, self.detect_minArea, self.detect_maxArea, self.detect_th1, self.detect_th2, self.detect_thstep, self.use_hough)
+
     def createDetector(self):
+        self._params_sig = self.detectorSignature()
         # Setup SimpleBlobDetector parameters.
         params = cv2.SimpleBlobDetector_Params()
         # Thresholds
+        # frames reaching the detector are already binary (adaptive threshold), so every
+        # pass between th1 and th2 finds the same contours: run a single pass instead
         params.minThreshold = self.detect_th1
-        params.maxThreshold = self.detect_th2
+        params.maxThreshold = self.detect_th1 + self.detect_thstep
         params.thresholdStep = self.detect_thstep
+        params.minRepeatability = 1
 
         # Area
         params.filterByArea = True         # Filter by Area.
         params.minArea = self.detect_minArea
+        params.maxArea = self.detect_maxArea
 
         # Circularity
         params.filterByCircularity = True  # Filter by Circularity
@@ -1120,14 +1271,75 @@ class CalibrateNozzles(QThread):
         # create detector
         self.detector = cv2.SimpleBlobDetector_create(params)
 
-    def adjust_gamma(self, image, gamma=1.2):
-        # build a lookup table mapping the pixel values [0, 255] to
-        # their adjusted gamma values
-        invGamma = 1.0 / gamma
-        table = np.array([((i / 255.0) ** invGamma) * 255
-            for i in np.arange(0, 256)]).astype('uint8')
+        # HoughCircles radius limits derived from blob area
+        if self.use_hough:
+            # same size window as the blob detector: minArea..maxArea
+            self.hough_minRadius = int(np.sqrt(self.detect_minArea/np.pi)*0.8)
+            self.hough_maxRadius = int(np.ceil(np.sqrt(self.detect_maxArea/np.pi)))
+
+    def houghDetect(self, image):
+        # gradient-normal voting: only edge pixels vote, no full-frame blob labelling
+        # one pass over the whole radius range, so edges are found once and minDist suppresses across all radii
+        # (roiDetect hands in the small tracking window once the nozzle has been found)
+        center = (image.shape[1]/2, image.shape[0]/2)
+        if self.use_opencl:
+            # upload once, edge detection and voting run on the GPU
+            image = cv2.UMat(image)
+        result = cv2.HoughCircles(image, cv2.HOUGH_GRADIENT_ALT, dp=1.5, minDist=20, param1=300, param2=0.85, minRadius=self.hough_minRadius, maxRadius=self.hough_maxRadius)
+        if self.use_opencl and result is not None:
+            result = result.get()
+        if result is None or len(result) == 0:
+            return []
+        circles = result[0]
+        # keep only the strongest candidate: the circle closest to frame center
+        (x, y, r) = min(circles, key=lambda c: (c[0]-center[0])**2 + (c[1]-center[1])**2)
+        # return as keypoint so downstream drawing/sizing is unchanged
+        return [cv2.KeyPoint(float(x), float(y), float(2*r))]
+
+    def roiDetect(self, detect, image):
+        # during alignment, search only a small window around the last detected nozzle
+        if self.alignment and self.last_center is not None:
+            (cx, cy) = self.last_center
+            half = int(2*self.last_radius) + self.roi_padding + self.roi_travel
+            x0 = max(0, cx - half)
+            y0 = max(0, cy - half)
+            roi = image[y0:cy+half, x0:cx+half]
+            keypoints = detect(roi)
+            # a blob cut off by the window edge still looks round enough but has a biased centre
+            if len(keypoints) == 1 and not self.touchesBorder(keypoints[0], roi.shape):
+                keypoints = [cv2.KeyPoint(keypoints[0].pt[0]+x0, keypoints[0].pt[1]+y0, keypoints[0].size)]
+                self.trackKeypoint(keypoints[0])
+                return keypoints
+        # no previous position, nozzle left or was clipped by the window: search the full frame
+        keypoints = detect(image)
+        if self.alignment and len(keypoints) == 1:
+            self.trackKeypoint(keypoints[0])
+        else:
+            self.last_center = None
+        return keypoints
+
+    def touchesBorder(self, keypoint, shape):
+        r = keypoint.size/2
+        (x, y) = keypoint.pt
+        return x - r <= 0 or y - r <= 0 or x + r >= shape[1] - 1 or y + r >= shape[0] - 1
+
+    def trackKeypoint(self, keypoint):
+        self.last_center = (int(keypoint.pt[0]), int(keypoint.pt[1]))
+        self.last_radius = keypoint.size/2
+
+    def adjust_gamma(self, image, gamma=1.2, dst=None):
         # apply gamma correction using the lookup table
-        return cv2.LUT(image, table)
+        return cv2.LUT(image, self.gammaTable(gamma), dst=dst)
+
+    def gammaTable(self, gamma):
+        # build a lookup table mapping the pixel values [0, 255] to
+        # their adjusted gamma values, once per gamma value
+        table = self._gamma_tables.get(gamma)
+        if table is None:
+            invGamma = 1.0 / gamma
+            table = ((np.arange(0, 256) / 255.0) ** invGamma * 255).astype('uint8')
+            self._gamma_tables[gamma] = table
+        return table
 
     def putText(self, frame,text,color=(0, 0, 255),offsetx=0,offsety=0,stroke=1):  # Offsets are in character box size in pixels. 
         if (text == 'timestamp'): text = datetime.datetime.now().strftime('%m-%d-%Y %H:%M:%S')
@@ -1150,42 +1362,46 @@ class CalibrateNozzles(QThread):
 
     def changeVideoSrc(self, newSrc=-1):
         self.cap.release()
-        video_src = newSrc
+        self.video_src = newSrc
         # Start Video feed
-        self.cap.open(video_src)
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, camera_width)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, camera_height)
-        self.cap.set(cv2.CAP_PROP_BUFFERSIZE,1)
-        #self.cap.set(cv2.CAP_PROP_FPS,25)
+        self.openCapture()
         self.brightness_default = self.cap.get(cv2.CAP_PROP_BRIGHTNESS)
         self.contrast_default = self.cap.get(cv2.CAP_PROP_CONTRAST)
         self.saturation_default = self.cap.get(cv2.CAP_PROP_SATURATION)
         self.hue_default = self.cap.get(cv2.CAP_PROP_HUE)
 
-        self.ret, self.cv_img = self.cap.read()
+        self.ret, frame = self.readFrame()
         if self.ret:
-            local_img = self.cv_img
-            self.change_pixmap_signal.emit(local_img)
-        else:
-            self.cap.open(video_src)
-            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, camera_width)
-            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, camera_height)
-            self.cap.set(cv2.CAP_PROP_BUFFERSIZE,1)
-            #self.cap.set(cv2.CAP_PROP_FPS,25)
-            self.ret, self.cv_img = self.cap.read()
-            local_img = self.cv_img
-            self.change_pixmap_signal.emit(local_img)
+            self.emitFrame(frame)
 
 class App(QMainWindow):
     cp_coords = {}
     numTools = 0
-    current_frame = np.ndarray
     mutex = QMutex()
     debugString = ''
-    calibrationResults = []
+    settings_status_signal = pyqtSignal(str)
+    disconnect_signal = pyqtSignal(int)
+    # (attribute, menu text, slot, slot keyword arguments)
+    menu_actions = (
+        ('debugAction', '&Debug info', 'displayDebug', None),
+        ('cameraAction', '&Camera settings', 'displayCameraSettings', None),
+        ('quitAction', '&Quit', 'close', None),
+        ('saveAction', '&Save current settings', 'saveUserParameters', None),
+        ('graphAction', '&Graph calibration data..', 'analyzeResults', {'graph': True}),
+        ('exportAction', '&Export to output.json', 'analyzeResults', {'export': True})
+    )
 
     def __init__(self, parent=None):
         super().__init__()
+        # calibration results: dicts for export, typed columns for stats and graphs
+        self.calibrationResults = []
+        self.calibrationData = { key: np.empty(64, dtype=dtype) for (key, dtype) in calibration_fields }
+        # settings.json writes run here, one at a time, off the GUI thread
+        self.settings_pool = ThreadPoolExecutor(max_workers=1)
+        self.settings_status_signal.connect(self.updateStatusbar)
+        # blocking printer requests made on behalf of the GUI run here
+        self.printer_pool = ThreadPoolExecutor(max_workers=1)
+        self.disconnect_signal.connect(self.finishDisconnect)
         self.setWindowFlag(Qt.WindowContextHelpButtonHint,False)
         self.setWindowTitle('TAMV')
         self.setWindowIcon(QIcon('jubilee.png'))
@@ -1224,80 +1440,6 @@ class App(QMainWindow):
             app_screen = self.frameGeometry()
             app_screen.moveCenter(screen.center())
             self.move(app_screen.topLeft())
-        # SET UP STYLESHEETS FOR GUI ELEMENTS
-        self.setStyleSheet(
-            '\
-            QPushButton {\
-                border: 1px solid #adadad;\
-                border-style: outset;\
-                border-radius: 4px;\
-                font: 14px;\
-                padding: 6px;\
-            }\
-            QPushButton:hover,QPushButton:enabled:hover,QPushButton:enabled:!checked:hover {\
-                background-color: #27ae60;\
-                border: 1px solid #aaaaaa;\
-            }\
-            QPushButton:pressed,QPushButton:enabled:pressed,QPushButton:enabled:checked {\
-                background-color: #ae2776;\
-                border: 1px solid #aaaaaa;\
-            }\
-            QPushButton:enabled {\
-                background-color: green;\
-                color: white;\
-            }\
-            QPushButton#debug,QMessageBox > #debug {\
-                background-color: blue;\
-                color: white;\
-            }\
-            QPushButton#debug:hover, QMessageBox > QAbstractButton#debug:hover {\
-                background-color: green;\
-                color: white;\
-            }\
-            QPushButton#debug:pressed, QMessageBox > QAbstractButton#debug:pressed {\
-                background-color: #ae2776;\
-                border-style: inset;\
-                color: white;\
-            }\
-            QPushButton#active, QMessageBox > QAbstractButton#active {\
-                background-color: green;\
-                color: white;\
-            }\
-            QPushButton#active:pressed,QMessageBox > QAbstractButton#active:pressed {\
-                background-color: #ae2776;\
-            }\
-            QPushButton#terminate {\
-                background-color: red;\
-                color: white;\
-            }\
-            QPushButton#terminate:pressed {\
-                background-color: #c0392b;\
-            }\
-            QPushButton:disabled, QPushButton#terminate:disabled {\
-                background-color: #cccccc;\
-                color: #999999;\
-            }\
-            QInputDialog QDialogButtonBox > QPushButton:enabled, QDialog QPushButton:enabled,QPushButton[checkable="true"]:enabled {\
-                background-color: none;\
-                color: black;\
-                border: 1px solid #adadad;\
-                border-style: outset;\
-                border-radius: 4px;\
-                font: 14px;\
-                padding: 6px;\
-            }\
-            QPushButton:enabled:checked {\
-                background-color: #ae2776;\
-                border: 1px solid #aaaaaa;\
-            }\
-            QInputDialog QDialogButtonBox > QPushButton:pressed, QDialog QPushButton:pressed {\
-                background-color: #ae2776;\
-            }\
-            QInputDialog QDialogButtonBox > QPushButton:hover:!pressed, QDialog QPushButton:hover:!pressed {\
-                background-color: #27ae60;\
-            }\
-            '
-        )
         # LOAD USER SAVED PARAMETERS OR CREATE DEFAULTS
         self.loadUserParameters()
         # GUI ELEMENTS DEFINITION
@@ -1307,7 +1449,6 @@ class App(QMainWindow):
         #if not self.small_display:
         self._createActions()
         self._createMenuBar()
-        self._connectActions()
         self.centralWidget = QWidget()
         self.setCentralWidget(self.centralWidget)
         # create the label that holds the image
@@ -1322,10 +1463,10 @@ class App(QMainWindow):
         # CP location on statusbar
         self.cp_label = QLabel('<b>CP:</b> <i>undef</i>')
         self.statusBar.addPermanentWidget(self.cp_label)
-        self.cp_label.setStyleSheet(style_red)
+        applyState(self.cp_label, 'red')
         # Connection status on statusbar
         self.connection_status = QLabel('Disconnected')
-        self.connection_status.setStyleSheet(style_red)
+        applyState(self.connection_status, 'red')
         self.statusBar.addPermanentWidget(self.connection_status)
         # BUTTONS
         # Connect
@@ -1347,36 +1488,12 @@ class App(QMainWindow):
         self.cp_button.setFixedWidth(170)
         #self.cp_button.setStyleSheet(style_disabled)
         self.cp_button.setDisabled(True)
-        #Threshold setter
-        ###############################################
-        # #Min Threshold slider
-        self.min_thslider = QSlider(Qt.Horizontal)
-        self.min_thslider.setMinimum(0)
-        self.min_thslider.setValue(int(self.detect_th1))
-        self.min_thslider.valueChanged.connect(self.changeThresholdSlider)
-        self.min_thslider.setTickPosition(QSlider.TicksBelow)
-        self.min_thslider.setTickInterval(5)
-        self.min_thslider_label = QLabel(str(int(self.detect_th1)))
-        self.min_thslider_label.setVisible(False)
-        self.min_thslider.setVisible(False)
-
-        # #Max Threshold slider
-        self.max_thslider = QSlider(Qt.Horizontal)
-        self.max_thslider.setMinimum(int(self.min_thslider.value()))
-        self.max_thslider.setMaximum(255)
-        self.max_thslider.setValue(int(self.detect_th2))
-        self.max_thslider.valueChanged.connect(self.changeThresholdSlider)
-        self.max_thslider.setTickPosition(QSlider.TicksBelow)
-        self.max_thslider.setTickInterval(5)
-        self.max_thslider_label = QLabel(str(int(self.detect_th2)))
-        self.max_thslider_label.setVisible(False)
-        self.max_thslider.setVisible(False)
-        self.min_thslider.setMaximum(self.max_thslider.value())
-        # Thresholdset button
-        self.set_thres_button = QPushButton('Set Binary Threshold limit')
-        self.set_thres_button.setToolTip('Define pixel brightness thesholds for finding circle borders')
-        self.set_thres_button.clicked.connect(self.changeThreshold)
-        ###############################################
+        #Threshold setter, built on first use
+        self.min_thslider = None
+        # tool load/unload confirmation, built on first use
+        self.confirm_box = None
+        # printer URL prompt, built on first use
+        self.url_dialog = None
         
         # Calibration
         self.calibration_button = QPushButton('Start Tool Alignment')
@@ -1461,119 +1578,176 @@ class App(QMainWindow):
         # create a grid box layout
         grid = QGridLayout()
         grid.setSpacing(3)
-        # add elements to grid
-        # FIRST ROW
-        grid.addWidget(self.connection_button,1,1,Qt.AlignLeft)
-        grid.addWidget(self.detect_box,1,2,1,1)
-        grid.addWidget(self.xray_box,1,3,1,1)
-        grid.addWidget(self.loose_box,1,4,1,1)
-        grid.addWidget(self.invert_box,1,5,1,1)
-        grid.addWidget(self.toolBox,1,6,1,1)
-        grid.addWidget(self.disconnection_button,1,7,1,-1,Qt.AlignLeft)
-        # SECOND ROW
-        grid.addWidget(self.min_thslider,2,1,1,2)
-        grid.addWidget(self.min_thslider_label,2,3,1,1)
-        grid.addWidget(self.max_thslider,2,4,1,2)
-        grid.addWidget(self.max_thslider_label,2,6,1,1)
-        grid.addWidget(self.set_thres_button,2,7,1,1)
-        ####
-        # THIRD ROW
-        # main image viewer
-        grid.addWidget(self.image_label,3,1,4,6)
-        grid.addWidget(self.jogpanel_button,3,7,1,1)
-        grid.addWidget(self.offsets_box,4,7,1,1)
+        # add elements to grid: (widget, row, column, row span, column span, alignment)
+        no_align = Qt.Alignment()
+        grid_layout = [
+            # FIRST ROW
+            (self.connection_button,1,1,1,1,Qt.AlignLeft),
+            (self.detect_box,1,2,1,1,no_align),
+            (self.xray_box,1,3,1,1,no_align),
+            (self.loose_box,1,4,1,1,no_align),
+            (self.invert_box,1,5,1,1,no_align),
+            (self.toolBox,1,6,1,1,no_align),
+            (self.disconnection_button,1,7,1,-1,Qt.AlignLeft),
+            # SECOND ROW: threshold controls, see createThresholdControls
+            # THIRD ROW
+            # main image viewer
+            (self.image_label,3,1,4,6,no_align),
+            (self.jogpanel_button,3,7,1,1,no_align),
+            (self.offsets_box,4,7,1,1,no_align),
+            (self.debug_button,6,7,1,1,no_align),
+            # FOURTH ROW
+            (self.cp_button,7,1,1,1,no_align),
+            (self.calibration_button,7,2,1,1,no_align),
+            (self.repeat_label,7,3,1,1,no_align),
+            (self.repeatSpinBox,7,4,1,1,no_align)
+        ]
         if self.small_display:
-            grid.addWidget(self.exit_button,5,7,1,1)
-        grid.addWidget(self.debug_button,6,7,1,1)
-        # FOURTH ROW
-        grid.addWidget(self.cp_button,7,1,1,1)
-        grid.addWidget(self.calibration_button,7,2,1,1)
-        grid.addWidget(self.repeat_label,7,3,1,1)
-        grid.addWidget(self.repeatSpinBox,7,4,1,1)
+            grid_layout.append((self.exit_button,5,7,1,1,no_align))
+        for widget, row, column, row_span, column_span, align in grid_layout:
+            grid.addWidget(widget, row, column, row_span, column_span, align)
+        self.grid = grid
         # set the grid layout as the widgets layout
         self.centralWidget.setLayout(grid)
-        # start video feed
-        self.startVideo()
         # flag to draw circle
         self.crosshair = False
+        # start video feed
+        self.startVideo()
+
+
+    def createThresholdControls(self):
+        # the threshold row stays hidden until a printer is connected or detection is turned on, so it is only built then
+        # #Min Threshold slider
+        self.min_thslider = QSlider(Qt.Horizontal)
+        self.min_thslider.setMinimum(0)
+        self.min_thslider.setValue(int(self.detect_th1))
+        self.min_thslider.valueChanged.connect(self.changeThresholdSlider)
+        self.min_thslider.setTickPosition(QSlider.TicksBelow)
+        self.min_thslider.setTickInterval(5)
+        self.min_thslider_label = QLabel(str(int(self.detect_th1)))
 
+        # #Max Threshold slider
+        self.max_thslider = QSlider(Qt.Horizontal)
+        self.max_thslider.setMinimum(int(self.min_thslider.value()))
+        self.max_thslider.setMaximum(255)
+        self.max_thslider.setValue(int(self.detect_th2))
+        self.max_thslider.valueChanged.connect(self.changeThresholdSlider)
+        self.max_thslider.setTickPosition(QSlider.TicksBelow)
+        self.max_thslider.setTickInterval(5)
+        self.max_thslider_label = QLabel(str(int(self.detect_th2)))
+        self.min_thslider.setMaximum(self.max_thslider.value())
+        # coalesce label updates while a slider is dragged, at most one refresh per frame
+        self.thslider_timer = QTimer(self)
+        self.thslider_timer.setSingleShot(True)
+        self.thslider_timer.setInterval(16)
+        self.thslider_timer.timeout.connect(self.applyThresholdLabels)
+        # Thresholdset button
+        self.set_thres_button = QPushButton('Set Binary Threshold limit')
+        self.set_thres_button.setToolTip('Define pixel brightness thesholds for finding circle borders')
+        self.set_thres_button.clicked.connect(self.changeThreshold)
+        self.grid.addWidget(self.min_thslider,2,1,1,2)
+        self.grid.addWidget(self.min_thslider_label,2,3,1,1)
+        self.grid.addWidget(self.max_thslider,2,4,1,2)
+        self.grid.addWidget(self.max_thslider_label,2,6,1,1)
+        self.grid.addWidget(self.set_thres_button,2,7,1,1)
+
+    def setThresholdControlsVisible(self, visible):
+        if self.min_thslider is None:
+            if not visible:
+                return
+            self.createThresholdControls()
+        self.set_thres_button.setDisabled(not visible)
+        self.set_thres_button.setVisible(visible)
+        self.min_thslider.setVisible(visible)
+        self.max_thslider.setVisible(visible)
+        self.min_thslider_label.setVisible(visible)
+        self.max_thslider_label.setVisible(visible)
 
     def changeThresholdSlider(self):
-        self.min_thslider_label.setText(str(int(self.min_thslider.value())))
-        self.max_thslider_label.setText(str(int(self.max_thslider.value())))
+        if not self.thslider_timer.isActive():
+            self.thslider_timer.start()
+
+    def applyThresholdLabels(self):
+        self.min_thslider_label.setText(str(self.min_thslider.value()))
+        self.max_thslider_label.setText(str(self.max_thslider.value()))
 
                                                 
     def changeThreshold(self):
-        if(self.detect_th1 != int(self.min_thslider.value()) or self.detect_th2 != int(self.max_thslider.value())):
-            self.detect_th1 = int(self.min_thslider.value())
-            self.detect_th2 = int(self.max_thslider.value())
-            self.min_thslider.setMaximum(int(self.max_thslider.value()))
-            self.max_thslider.setMinimum(int(self.min_thslider.value()))
-            self.statusBar.showMessage(f"Binary thresholds change to: {self.detect_th1}, {self.detect_th2}.")
-            self.detector_changed = True
+        th1 = self.min_thslider.value()
+        th2 = self.max_thslider.value()
+        if th1 == self.detect_th1 and th2 == self.detect_th2:
+            return
+        self.detect_th1 = th1
+        self.detect_th2 = th2
+        # clamp each slider to the other without re-entering changeThresholdSlider
+        with QSignalBlocker(self.min_thslider), QSignalBlocker(self.max_thslider):
+            self.min_thslider.setMaximum(th2)
+            self.max_thslider.setMinimum(th1)
+        self.statusBar.showMessage(f"Binary thresholds change to: {self.detect_th1}, {self.detect_th2}.")
+        self.detector_changed = True
         
+    @pyqtSlot()
     def toggle_detect(self):
-        self.video_thread.display_crosshair = not self.video_thread.display_crosshair
-        self.video_thread.detection_on = not self.video_thread.detection_on
-        if self.video_thread.detection_on:
-            self.xray_box.setDisabled(False)
-            self.xray_box.setVisible(True)
-            self.loose_box.setDisabled(False)
-            self.loose_box.setVisible(True)
-            self.invert_box.setDisabled(False)
-            self.invert_box.setVisible(True)
-            self.set_thres_button.setDisabled(False)
-            self.set_thres_button.setVisible(True)
-            self.min_thslider.setVisible(True)
-            self.max_thslider.setVisible(True)
-            self.min_thslider_label.setVisible(True)
-            self.max_thslider_label.setVisible(True)
-        else:
-            self.xray_box.setDisabled(True)
-            self.xray_box.setVisible(False)
-            self.loose_box.setDisabled(True)
-            self.loose_box.setVisible(False)
+        detecting = not self.video_thread.detection_on
+        self.video_thread.setDetection(detecting)
+        # batch the visibility changes into a single relayout/repaint
+        with updatesSuspended(self.centralWidget):
+            self.xray_box.setDisabled(not detecting)
+            self.xray_box.setVisible(detecting)
+            self.loose_box.setDisabled(not detecting)
+            self.loose_box.setVisible(detecting)
             self.invert_box.setDisabled(False)
             self.invert_box.setVisible(True)
-            self.set_thres_button.setDisabled(True)
-            self.set_thres_button.setVisible(False)
-            self.min_thslider.setVisible(False)
-            self.max_thslider.setVisible(False)
-            self.min_thslider_label.setVisible(False)
-            self.max_thslider_label.setVisible(False)
+            self.setThresholdControlsVisible(detecting)
+        if not detecting:
             self.updateStatusbar('Detection: OFF')
 
+    def promptPrinterURL(self, label, text):
+        # one URL dialog, reused for every connection attempt and retry
+        if self.url_dialog is None:
+            self.url_dialog = QInputDialog(self)
+            self.url_dialog.setWindowTitle('Machine URL')
+            self.url_dialog.setInputMode(QInputDialog.TextInput)
+            self.url_dialog.setTextEchoMode(QLineEdit.Normal)
+            url_edit = self.url_dialog.findChild(QLineEdit)
+            if url_edit is not None:
+                url_edit.setValidator(QRegularExpressionValidator(QRegularExpression(r'^https?://\S+$'), url_edit))
+        self.url_dialog.setLabelText(label)
+        self.url_dialog.setTextValue(text)
+        ok = self.url_dialog.exec_() == QDialog.Accepted
+        return( self.url_dialog.textValue(), ok )
+
     def cleanPrinterURL(self, inputString='http://localhost'):
-        _errCode = 0
-        _errMsg = ''
-        _printerURL = 'http://localhost'
-        from urllib.parse import urlparse
         u = urlparse(inputString)
-        scheme = u[0]
-        netlocation = u[1]
-        if len(scheme) < 4 or scheme.lower() not in ['http']:
+        scheme = u.scheme.lower()
+        if scheme == 'https':
+            _errCode = 3
+        elif scheme not in _url_schemes:
             _errCode = 1
-            _errMsg = 'Invalid scheme. Please only use http connections.'
-        elif len(netlocation) < 1:
+        elif len(u.netloc) < 1:
             _errCode = 2
-            _errMsg = 'Invalid IP/network address.'
-        elif scheme.lower() in ['https']:
-            _errCode = 3
-            _errMsg = 'Cannot use https connections for Duet controllers'
         else:
-            _printerURL = scheme + '://' + netlocation
-        return( _errCode, _errMsg, _printerURL )
+            return( 0, '', scheme + '://' + u.netloc )
+        return( _errCode, _url_errors[_errCode], 'http://localhost' )
 
     def loadUserParameters(self):
-        global camera_width, camera_height, video_src
+        global camera_width, camera_height, video_src, use_gstreamer, use_hough
         try:
-            with open('settings.json','r') as inputfile:
-                options = json.load(inputfile)
+            st = os.stat('settings.json')
+            if st.st_mtime == _settings_cache['mtime']:
+                options = _settings_cache['data']
+            else:
+                with open('settings.json','r') as inputfile:
+                    options = json.load(inputfile)
+                _settings_cache['mtime'] = st.st_mtime
+                _settings_cache['data'] = options
             camera_settings = options['camera'][0]
             camera_height = int( camera_settings['display_height'] )
             camera_width = int( camera_settings['display_width'] )
             video_src = camera_settings['video_src']
             if len(str(video_src)) == 1: video_src = int(video_src)
+            use_gstreamer = bool( camera_settings.get('gstreamer', False) )
+            use_hough = bool( camera_settings.get('hough', False) )
             printer_settings = options['printer'][0]
             tempURL = printer_settings['address']
             ( _errCode, _errMsg, self.printerURL ) = self.cleanPrinterURL(tempURL)
@@ -1589,7 +1763,9 @@ class App(QMainWindow):
             options['camera'].append( {
                 'video_src': 0,
                 'display_width': '640',
-                'display_height': '480'
+                'display_height': '480',
+                'gstreamer': False,
+                'hough': False
             } )
             options['printer'] = []
             options['printer'].append( {
@@ -1600,14 +1776,22 @@ class App(QMainWindow):
                 camera_width = 640
                 camera_height = 480
                 video_src = 1
+                use_gstreamer = False
+                use_hough = False
                 with open('settings.json','w') as outputfile:
                     json.dump(options, outputfile)
+                self.cacheUserParameters(options)
             except Exception as e1:
                 print('Error writing user settings file.')
                 print(e1)
 
+    def cacheUserParameters(self, options):
+        # keep the cache in step with what was just written
+        _settings_cache['mtime'] = os.stat('settings.json').st_mtime
+        _settings_cache['data'] = json.loads(json.dumps(options))
+
     def saveUserParameters(self, cameraSrc=-2):
-        global camera_width, camera_height, video_src
+        global camera_width, camera_height, video_src, use_gstreamer, use_hough
         cameraSrc = int(cameraSrc)
         try:
             if cameraSrc > -2:
@@ -1617,21 +1801,33 @@ class App(QMainWindow):
             options['camera'].append( {
                 'video_src': video_src,
                 'display_width': camera_width,
-                'display_height': camera_height
+                'display_height': camera_height,
+                'gstreamer': use_gstreamer,
+                'hough': use_hough
             } )
             options['printer'] = []
             options['printer'].append( {
                 'address': self.printerURL,
                 'name': 'Default printer'
             } )
-            with open('settings.json','w') as outputfile:
-                json.dump(options, outputfile)
+            self.settings_pool.submit(self.writeUserParameters, options)
         except Exception as e1:
             print('Error saving user settings file.')
             print(e1)
         if int(video_src) != cameraSrc:
             self.video_thread.changeVideoSrc(newSrc=cameraSrc)
-        self.updateStatusbar('Current profile saved to settings.json')
+
+    def writeUserParameters(self, options):
+        # runs on settings_pool; report back through the signal
+        try:
+            with open('settings.json','w') as outputfile:
+                json.dump(options, outputfile)
+            self.cacheUserParameters(options)
+            self.settings_status_signal.emit('Current profile saved to settings.json')
+        except Exception as e1:
+            print('Error saving user settings file.')
+            print(e1)
+            self.settings_status_signal.emit('Error saving user settings file.')
 
     def _createMenuBar(self):
         menuBar = self.menuBar()
@@ -1652,29 +1848,14 @@ class App(QMainWindow):
         self.analysisMenu.setDisabled(True)
 
     def _createActions(self):
-        # Creating action using the first constructor
-        self.debugAction = QAction(self)
-        self.debugAction.setText('&Debug info')
-        self.cameraAction = QAction(self)
-        self.cameraAction.setText('&Camera settings')
-        self.quitAction = QAction(self)
-        self.quitAction.setText('&Quit')
-        self.saveAction = QAction(self)
-        self.saveAction.setText('&Save current settings')
-        self.graphAction = QAction(self)
-        self.graphAction.setText('&Graph calibration data..')
-        self.exportAction = QAction(self)
-        self.exportAction.setText('&Export to output.json')
-
-    def _connectActions(self):
-        # Connect File actions
-        self.debugAction.triggered.connect(self.displayDebug)
-        self.cameraAction.triggered.connect(self.displayCameraSettings)
-        self.quitAction.triggered.connect(self.close)
-        self.saveAction.triggered.connect(self.saveUserParameters)
-
-        self.graphAction.triggered.connect(lambda: self.analyzeResults(graph=True))
-        self.exportAction.triggered.connect(lambda: self.analyzeResults(export=True))
+        # create and connect the menu actions from one table
+        for attr, text, slot, kwargs in self.menu_actions:
+            action = QAction(text, self)
+            if kwargs is None:
+                action.triggered.connect(getattr(self, slot))
+            else:
+                action.triggered.connect(lambda checked=False, slot=getattr(self, slot), kwargs=kwargs: slot(**kwargs))
+            setattr(self, attr, action)
 
     def displayCameraSettings(self):
         self.camera_dialog = CameraSettingsDialog(parent=self)
@@ -1702,7 +1883,7 @@ class App(QMainWindow):
         self.video_thread.detection_error.connect(self.updateStatusbar)
         self.video_thread.status_update.connect(self.updateStatusbar)
         self.video_thread.message_update.connect(self.updateMessagebar)
-        self.video_thread.change_pixmap_signal.connect(self.update_image)
+        self.video_thread.change_pixmap_signal.connect(self.update_image, Qt.QueuedConnection)
         self.video_thread.calibration_complete.connect(self.applyCalibration)
         self.video_thread.result_update.connect(self.addCalibrationResult)
 
@@ -1722,14 +1903,17 @@ class App(QMainWindow):
         try:
             if self.printer.isIdle():
                 tempCoords = self.printer.getCoords()
-                self.printer.gCode('T-1')
-                self.printer.gCode('G1 X' + str(tempCoords['X']) + ' Y' + str(tempCoords['Y']))
+                self.printer.gCode(f"T-1\nG1 X{tempCoords['X']} Y{tempCoords['Y']}")
         except Exception as ce1: None # no printer connected usually.
+        # flush any pending settings write and printer requests
+        self.settings_pool.shutdown(wait=True)
+        self.printer_pool.shutdown(wait=True)
         print()
         print('Thank you for using TAMV!')
         print('Check out www.jubilee3d.com')
         event.accept()
 
+    @pyqtSlot()
     def connectToPrinter(self):
         # temporarily suspend GUI and display status message
         self.image_label.setText('Waiting to connect..')
@@ -1741,9 +1925,9 @@ class App(QMainWindow):
         self.jogpanel_button.setDisabled(True)
         self.offsets_box.setVisible(False)
         self.connection_status.setText('Connecting..')
-        self.connection_status.setStyleSheet(style_orange)
+        applyState(self.connection_status, 'orange')
         self.cp_label.setText('<b>CP:</b> <i>undef</i>')
-        self.cp_label.setStyleSheet(style_orange)
+        applyState(self.cp_label, 'orange')
         self.repeatSpinBox.setDisabled(True)
         self.xray_box.setDisabled(True)
         self.xray_box.setChecked(False)
@@ -1754,7 +1938,8 @@ class App(QMainWindow):
         self.invert_box.setDisabled(True)
         self.invert_box.setChecked(False)
         self.invert_box.setVisible(False)
-        self.repaint()
+        # the modal URL prompt below runs the event loop, a queued paint is enough
+        self.update()
         try:
             # check if printerURL has already been defined (user reconnecting)
             if len(self.printerURL) > 0:
@@ -1763,13 +1948,13 @@ class App(QMainWindow):
             # printerURL initalization to defaults
             self.printerURL = 'http://localhost'
         # Prompt user for machine connection address
-        text, ok = QInputDialog.getText(self, 'Machine URL','Machine IP address or hostname: ', QLineEdit.Normal, self.printerURL)
+        text, ok = self.promptPrinterURL('Machine IP address or hostname: ', self.printerURL)
         # Handle clicking OK/Connect
         if ok and text != '' and len(text) > 5:
             ( _errCode, _errMsg, tempURL ) = self.cleanPrinterURL(text)
             while _errCode != 0:
                 # Invalid URL detected, pop-up window to correct this
-                text, ok = QInputDialog.getText(self, 'Machine URL', _errMsg + '\nMachine IP address or hostname: ', QLineEdit.Normal, text)
+                text, ok = self.promptPrinterURL(_errMsg + '\nMachine IP address or hostname: ', text)
                 if ok:
                     ( _errCode, _errMsg, tempURL ) = self.cleanPrinterURL(text)
                 else:
@@ -1793,7 +1978,8 @@ class App(QMainWindow):
         # Attempt connecting to the Duet controller
         try:
             self.printer = DWA.DuetWebAPI(self.printerURL)
-            if not self.printer.printerType():
+            printer_type = self.printer.printerType()
+            if not printer_type:
                 # connection failed for some reason
                 self.updateStatusbar('Device at '+self.printerURL+' either did not respond or is not a Duet V2 or V3 printer.')
                 self.resetConnectInterface()
@@ -1801,22 +1987,20 @@ class App(QMainWindow):
             else:
                 # connection succeeded, update objects accordingly
                 self._connected_flag = True
-                self.num_tools = self.printer.getNumTools()
+                # fetch all tool offsets in one request, falling back to querying tools one by one
+                try:
+                    tool_offsets = self.printer.getToolOffsets()
+                    self.num_tools = len(tool_offsets)
+                except Exception as conn2:
+                    print('Batched tool offset request failed: ', conn2)
+                    self.num_tools = self.printer.getNumTools()
+                    tool_offsets = [self.printer.getG10ToolOffset(i) for i in range(self.num_tools)]
                 self.video_thread.numTools = self.num_tools
                 # UPDATE OFFSET INFORMATION
                 self.offsets_box.setVisible(True)
                 self.offsets_table.setRowCount(self.num_tools)
+                self.fillOffsetsTable(tool_offsets)
                 for i in range(self.num_tools):
-                    current_tool = self.printer.getG10ToolOffset(i)
-                    offset_x = "{:.3f}".format(current_tool['X'])
-                    offset_y = "{:.3f}".format(current_tool['Y'])
-                    x_tableitem = QTableWidgetItem(offset_x)
-                    y_tableitem = QTableWidgetItem(offset_y)
-                    x_tableitem.setBackground(QColor(255,255,255,255))
-                    y_tableitem.setBackground(QColor(255,255,255,255))
-                    self.offsets_table.setVerticalHeaderItem(i,QTableWidgetItem('T'+str(i)))
-                    self.offsets_table.setItem(i,0,x_tableitem)
-                    self.offsets_table.setItem(i,1,y_tableitem)
                     # add tool buttons
                     toolButton = QPushButton('T'+str(i))
                     toolButton.setToolTip('Fetch T' + str(i) + ' to current machine position.')
@@ -1827,20 +2011,18 @@ class App(QMainWindow):
             self.resetConnectInterface()
             return
         # Get active tool
-        _active = self.printer.getCurrentTool()
+        _active = int(self.printer.getCurrentTool())
         # Display toolbox
         for i,button in enumerate(self.toolButtons):
             button.setCheckable(True)
-            if int(_active) == i:
-                button.setChecked(True)
-            else: 
-                button.setChecked(False)
-            button.clicked.connect(self.callTool)
+            button.setChecked(_active == i)
+            button.clicked.connect(partial(self.callTool, i))
             self.toolBoxLayout.addWidget(button)
         self.toolBox.setVisible(True)
         # Connection succeeded, update GUI first
-        self.updateStatusbar('Connected to a Duet V'+str(self.printer.printerType()))
-        self.connection_button.setText('Online: ' + self.printerURL[self.printerURL.rfind('/')+1:])
+        self.printerHost = urlparse(self.printerURL).netloc
+        self.updateStatusbar('Connected to a Duet V'+str(printer_type))
+        self.connection_button.setText('Online: ' + self.printerHost)
         self.statusBar.showMessage('Connected to printer at ' + self.printerURL, 5000)
         self.connection_status.setText('Connected.')
         self.image_label.setText('Set your Controlled Point to continue.')
@@ -1851,49 +2033,58 @@ class App(QMainWindow):
         self.cp_button.setDisabled(False)
         self.jogpanel_button.setDisabled(False)
         self.analysisMenu.setDisabled(True)
-        self.min_thslider_label.setVisible(True)
-        self.min_thslider.setVisible(True)
-        self.max_thslider_label.setVisible(True)
-        self.max_thslider.setVisible(True)
-        self.set_thres_button.setVisible(True)
+        self.setThresholdControlsVisible(True)
         # update connection status indicator to green
-        self.connection_status.setStyleSheet(style_green)
-        self.cp_label.setStyleSheet(style_red)
-
-    def callTool(self):
+        applyState(self.connection_status, 'green')
+        applyState(self.cp_label, 'red')
+
+    def fillOffsetsTable(self, tool_offsets):
+        # one relayout and repaint for the whole table instead of one per item
+        table = self.offsets_table
+        header = table.horizontalHeader()
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+        header.setSectionResizeMode(QHeaderView.Fixed)
+        try:
+            for i, current_tool in enumerate(tool_offsets):
+                x_tableitem = QTableWidgetItem(f"{current_tool['X']:.3f}")
+                y_tableitem = QTableWidgetItem(f"{current_tool['Y']:.3f}")
+                x_tableitem.setBackground(color_white)
+                y_tableitem.setBackground(color_white)
+                table.setVerticalHeaderItem(i,QTableWidgetItem('T'+str(i)))
+                table.setItem(i,0,x_tableitem)
+                table.setItem(i,1,y_tableitem)
+        finally:
+            header.setSectionResizeMode(QHeaderView.Stretch)
+            table.blockSignals(False)
+            table.setUpdatesEnabled(True)
+
+    def callTool(self, tool_index, checked=False):
         # handle scenario where machine is busy and user tries to select a tool.
         if not self.printer.isIdle():
             self.updateStatusbar('Machine is not idle, cannot select tool.')
             return
 
         # get current active tool
-        _active = self.printer.getCurrentTool()
+        _active = int(self.printer.getCurrentTool())
         
-        # get requested tool number
-        sender = self.sender()
+        # requested tool
+        toolName = 'T' + str(tool_index)
+        toolButton = self.toolButtons[tool_index]
 
         # update buttons to new status
         for button in self.toolButtons:
             button.setChecked(False)
-        self.toolButtons[int(self.sender().text()[1:])].setChecked(True)
+        toolButton.setChecked(True)
 
         # handle tool already active on printer
-        if int(_active) == int(sender.text()[1:]):
-            msg = QMessageBox()
-            status = msg.question( self, 'Unload ' + sender.text(), 'Unload ' + sender.text() + ' and return carriage to the current position?',QMessageBox.Yes | QMessageBox.No  )
+        if _active == tool_index:
+            status = self.confirmTool( 'Unload ' + toolName, 'Unload ' + toolName + ' and return carriage to the current position?' )
             if status == QMessageBox.Yes:
-                self.toolButtons[int(self.sender().text()[1:])].setChecked(False)
-                if len(self.cp_coords) > 0:
-                    self.printer.gCode('T-1')
-                    self.printer.gCode('G1 X' + str(self.cp_coords['X']))
-                    self.printer.gCode('G1 Y' + str(self.cp_coords['Y']))
-                    self.printer.gCode('G1 Z' + str(self.cp_coords['Z']))
-                else:
-                    tempCoords = self.printer.getCoords()
-                    self.printer.gCode('T-1')
-                    self.printer.gCode('G1 X' + str(tempCoords['X']))
-                    self.printer.gCode('G1 Y' + str(tempCoords['Y']))
-                    self.printer.gCode('G1 Z' + str(tempCoords['Z']))
+                toolButton.setChecked(False)
+                # one request: unload and return to CP (or the current position)
+                cp = self.cp_coords if len(self.cp_coords) > 0 else self.printer.getCoords()
+                self.printer.gCode(f"T-1\nG1 X{cp['X']} Y{cp['Y']} Z{cp['Z']}")
                 # End video threads and restart default thread
                 self.video_thread.alignment = False
 
@@ -1907,24 +2098,12 @@ class App(QMainWindow):
                 return
         else:
             # Requested tool is different from active tool
-            msg = QMessageBox()
-            status = msg.question( self, 'Confirm loading ' + sender.text(), 'Load ' + sender.text() + ' and move to current position?',QMessageBox.Yes | QMessageBox.No  )
+            status = self.confirmTool( 'Confirm loading ' + toolName, 'Load ' + toolName + ' and move to current position?' )
             
             if status == QMessageBox.Yes:
                 # return carriage to controlled point position
-                if len(self.cp_coords) > 0:
-                    self.printer.gCode('T-1')
-                    self.printer.gCode(sender.text())
-                    self.printer.gCode('G1 X' + str(self.cp_coords['X']))
-                    self.printer.gCode('G1 Y' + str(self.cp_coords['Y']))
-                    self.printer.gCode('G1 Z' + str(self.cp_coords['Z']))
-                else:
-                    tempCoords = self.printer.getCoords()
-                    self.printer.gCode('T-1')
-                    self.printer.gCode(self.sender().text())
-                    self.printer.gCode('G1 X' + str(tempCoords['X']))
-                    self.printer.gCode('G1 Y' + str(tempCoords['Y']))
-                    self.printer.gCode('G1 Z' + str(tempCoords['Z']))
+                cp = self.cp_coords if len(self.cp_coords) > 0 else self.printer.getCoords()
+                self.printer.gCode(f"T-1\n{toolName}\nG1 X{cp['X']} Y{cp['Y']} Z{cp['Z']}")
                 # START DETECTION THREAD HANDLING
                 # close camera settings dialog so it doesn't crash
                 try:
@@ -1938,43 +2117,52 @@ class App(QMainWindow):
                 self.repeatSpinBox.setDisabled(True)
 
             else:
-                self.toolButtons[int(self.sender().text()[1:])].setChecked(False)
-
-    def resetConnectInterface(self):
-        self.connection_button.setDisabled(False)
-        self.disconnection_button.setDisabled(True)
-        self.calibration_button.setDisabled(True)
-        self.cp_button.setDisabled(True)
-        self.jogpanel_button.setDisabled(True)
-        self.offsets_box.setVisible(False)
-        self.connection_status.setText('Disconnected')
-        self.connection_status.setStyleSheet(style_red)
-        self.cp_label.setText('<b>CP:</b> <i>undef</i>')
-        self.cp_label.setStyleSheet(style_red)
-        self.repeatSpinBox.setDisabled(True)
-        self.analysisMenu.setDisabled(True)
-        self.detect_box.setChecked(False)
-        self.detect_box.setDisabled(False)
-        self.xray_box.setDisabled(True)
-        self.xray_box.setChecked(False)
-        self.xray_box.setVisible(False)
-        self.loose_box.setDisabled(True)
-        self.loose_box.setChecked(False)
-        self.loose_box.setVisible(False)
-        self.video_thread.detection_on = False
-        self.video_thread.loose = False
-        self.video_thread.xray = False
-        self.video_thread.alignment = False
+                toolButton.setChecked(False)
 
-        index = self.toolBoxLayout.count()-1
-        while index >= 0:
-            curWidget = self.toolBoxLayout.itemAt(index).widget()
-            curWidget.setParent(None)
-            index -= 1
-        self.toolBox.setVisible(False)
-        self.toolButtons = []
-        self.repaint()
+    def confirmTool(self, title, text):
+        if self.confirm_box is None:
+            self.confirm_box = QMessageBox(QMessageBox.Question, '', '', QMessageBox.Yes | QMessageBox.No, self)
+        self.confirm_box.setWindowTitle(title)
+        self.confirm_box.setText(text)
+        return self.confirm_box.exec_()
 
+    @pyqtSlot()
+    def resetConnectInterface(self):
+        with updatesSuspended(self):
+            self.connection_button.setDisabled(False)
+            self.disconnection_button.setDisabled(True)
+            self.calibration_button.setDisabled(True)
+            self.cp_button.setDisabled(True)
+            self.jogpanel_button.setDisabled(True)
+            self.offsets_box.setVisible(False)
+            self.connection_status.setText('Disconnected')
+            applyState(self.connection_status, 'red')
+            self.cp_label.setText('<b>CP:</b> <i>undef</i>')
+            applyState(self.cp_label, 'red')
+            self.repeatSpinBox.setDisabled(True)
+            self.analysisMenu.setDisabled(True)
+            self.detect_box.setChecked(False)
+            self.detect_box.setDisabled(False)
+            self.xray_box.setDisabled(True)
+            self.xray_box.setChecked(False)
+            self.xray_box.setVisible(False)
+            self.loose_box.setDisabled(True)
+            self.loose_box.setChecked(False)
+            self.loose_box.setVisible(False)
+            self.video_thread.detection_on = False
+            self.video_thread.setLoose(False)
+            self.video_thread.xray = False
+            self.video_thread.alignment = False
+
+            # take the tool buttons out of the layout and let Qt destroy them from the event loop
+            while self.toolBoxLayout.count():
+                curWidget = self.toolBoxLayout.takeAt(0).widget()
+                if curWidget is not None:
+                    curWidget.deleteLater()
+            self.toolBox.setVisible(False)
+            self.toolButtons = []
+
+    @pyqtSlot()
     def controlledPoint(self):
         # handle scenario where machine is busy and user tries to select a tool.
         if not self.printer.isIdle():
@@ -1985,56 +2173,55 @@ class App(QMainWindow):
         self.calibration_button.setDisabled(True)
 
         if len(self.cp_coords) > 0:
-            self.printer.gCode('T-1')
-            self.printer.gCode('G90 G1 X'+ str(self.cp_coords['X']) + ' Y' + str(self.cp_coords['Y']) + ' Z' + str(self.cp_coords['Z']) )
+            cp = self.cp_coords
+            self.printer.gCode(f"T-1\nG90 G1 X{cp['X']} Y{cp['Y']} Z{cp['Z']}")
         dlg = CPDialog(parent=self)
         if dlg.exec_():
             self.cp_coords = self.printer.getCoords()
-            self.cp_string = '(' + str(self.cp_coords['X']) + ', ' + str(self.cp_coords['Y']) + ')'
+            self.cp_string = f"({self.cp_coords['X']}, {self.cp_coords['Y']})"
             self.readyToCalibrate()
         else:
             self.statusBar.showMessage('CP Setup cancelled.')
         self.crosshair = False
 
+    @pyqtSlot()
     def readyToCalibrate(self):
-        self.statusBar.showMessage('Controlled Point coordinates saved.',3000)
-        self.image_label.setText('Controlled Point set. Click \"Start Tool Alignment\" to calibrate..')
-        self.cp_button.setText('Reset CP ')
-        self.cp_label.setText('<b>CP:</b> ' + self.cp_string)
-        self.cp_label.setStyleSheet(style_green)
-        self.detect_box.setChecked(False)
-        self.detect_box.setDisabled(False)
-        self.detect_box.setVisible(True)
-        self.xray_box.setDisabled(True)
-        self.xray_box.setChecked(False)
-        self.xray_box.setVisible(False)
-        self.loose_box.setDisabled(True)
-        self.loose_box.setChecked(False)
-        self.loose_box.setVisible(False)
-        self.invert_box.setDisabled(True)
-        self.invert_box.setChecked(False)
-        self.invert_box.setVisible(False)
-        self.video_thread.detection_on = False
-        self.video_thread.loose = False
-        self.video_thread.xray = False
-        self.video_thread.alignment = False
-        self.calibration_button.setDisabled(False)
-        self.cp_button.setDisabled(False)
-        self.min_thslider_label.setVisible(True)
-        self.min_thslider.setVisible(True)
-        self.max_thslider_label.setVisible(True)
-        self.max_thslider.setVisible(True)
-        self.set_thres_button.setVisible(True)
-
-
-        self.toolBox.setVisible(True)
-        self.repeatSpinBox.setDisabled(False)
-
-        if len(self.calibrationResults) > 1:
-            self.analysisMenu.setDisabled(False)
-        else:
-            self.analysisMenu.setDisabled(True)
+        with updatesSuspended(self):
+            self.statusBar.showMessage('Controlled Point coordinates saved.',3000)
+            self.image_label.setText('Controlled Point set. Click \"Start Tool Alignment\" to calibrate..')
+            self.cp_button.setText('Reset CP ')
+            self.cp_label.setText('<b>CP:</b> ' + self.cp_string)
+            applyState(self.cp_label, 'green')
+            self.detect_box.setChecked(False)
+            self.detect_box.setDisabled(False)
+            self.detect_box.setVisible(True)
+            self.xray_box.setDisabled(True)
+            self.xray_box.setChecked(False)
+            self.xray_box.setVisible(False)
+            self.loose_box.setDisabled(True)
+            self.loose_box.setChecked(False)
+            self.loose_box.setVisible(False)
+            self.invert_box.setDisabled(True)
+            self.invert_box.setChecked(False)
+            self.invert_box.setVisible(False)
+            self.video_thread.detection_on = False
+            self.video_thread.setLoose(False)
+            self.video_thread.xray = False
+            self.video_thread.alignment = False
+            self.calibration_button.setDisabled(False)
+            self.cp_button.setDisabled(False)
+            self.setThresholdControlsVisible(True)
+
+
+            self.toolBox.setVisible(True)
+            self.repeatSpinBox.setDisabled(False)
+
+            if len(self.calibrationResults) > 1:
+                self.analysisMenu.setDisabled(False)
+            else:
+                self.analysisMenu.setDisabled(True)
 
+    @pyqtSlot()
     def applyCalibration(self):
         # update GUI
         self.readyToCalibrate()
@@ -2049,24 +2236,26 @@ class App(QMainWindow):
         msgBox.setText('Do you want to save the new offsets to your machine?')
         msgBox.setWindowTitle('Calibration Results')
         yes_button = msgBox.addButton('Apply offsets and save (M500)',QMessageBox.ApplyRole)
-        yes_button.setStyleSheet(style_green)
+        applyStyle(yes_button, style_green)
         cancel_button = msgBox.addButton('Apply offsets',QMessageBox.NoRole)
         
+        # build the offset commands once, for the debug string and for the machine
+        calibrationCodes = [f"G10 P{result['tool']} X{result['X']} Y{result['Y']}" for result in self.calibrationResults]
         # Update debug string
-        self.debugString += '\nCalibration results:\n'
-        for result in self.calibrationResults:
-            calibrationCode = 'G10 P' + str(result['tool']) + ' X' + str(result['X']) + ' Y' + str(result['Y'])
-            self.debugString += calibrationCode + '\n'
+        self.debugString += '\nCalibration results:\n' + ''.join(calibrationCode + '\n' for calibrationCode in calibrationCodes)
 
         # Prompt user
         returnValue = msgBox.exec()
         if msgBox.clickedButton() == yes_button:
-            for result in self.calibrationResults:
-                calibrationCode = 'G10 P' + str(result['tool']) + ' X' + str(result['X']) + ' Y' + str(result['Y'])
-                self.printer.gCode(calibrationCode)
-                self.printer.gCode('M500 P10') # because of Rene.
-            self.statusBar.showMessage('Offsets applied and stored using M500.')
-            print('Offsets applied and stored using M500.')
+            # later cycles supersede earlier ones: only the final G10 per tool is sent, so the request stays one short line per tool
+            finalCodes = dict(zip((result['tool'] for result in self.calibrationResults), calibrationCodes))
+            _ret_error = self.printer.gCode('\n'.join(list(finalCodes.values()) + ['M500 P10'])) # because of Rene.
+            if _ret_error == 0:
+                self.statusBar.showMessage('Offsets applied and stored using M500.')
+                print('Offsets applied and stored using M500.')
+            else:
+                self.statusBar.showMessage('Error applying offsets: controller returned ' + str(_ret_error))
+                print('Error applying offsets: controller returned', _ret_error)
         else:
             self.statusBar.showMessage('Temporary offsets applied. You must manually save these offsets.')
         # Clean up threads and detection
@@ -2082,12 +2271,17 @@ class App(QMainWindow):
             return
         if graph or export:
             # get data as 3 dimensional array [tool][axis][datapoints] normalized around mean of each axis
-            (numTools, totalRuns, toolData) = self.parseData(self.calibrationResults)
+            (numTools, totalRuns, toolData, toolMeans, toolSigmas) = self.parseData()
         else:
             # display stats to terminal
             self.stats()
         if graph:
+            # graphing imports, only paid for when a graph is requested
+            import matplotlib
             matplotlib.use('Qt5Agg',force=True)
+            import matplotlib.pyplot as plt
+            import matplotlib.patches as patches
+            from matplotlib.ticker import FormatStrFormatter
             # set up color and colormap arrays
             colorMap = ["Greens","Oranges","Blues", "Reds"] #["Blues", "Reds","Greens","Oranges"]
             colors = ['blue','red','green','orange']
@@ -2100,6 +2294,9 @@ class App(QMainWindow):
             #plt.switch_backend('Qt4Agg')
 
             fig, axes = plt.subplots(ncols=3,nrows=numTools,constrained_layout=False)
+            # shared across all tools: FormatStrFormatter keeps no per-axis state, and the fixed histogram settings
+            tick_formatter = FormatStrFormatter('%.3f')
+            hist_kwargs = dict(alpha=0.5, rwidth=.92, density=True, color=[colors[0],colors[1]], label=['X','Y'])
 
             for i, data in enumerate(toolData):
                 # create a color array the length of the number of tools in the data
@@ -2107,17 +2304,16 @@ class App(QMainWindow):
 
                 # Axis formatting
                 # Major ticks
-                axes[i][0].xaxis.set_major_formatter(FormatStrFormatter('%.3f'))
-                axes[i][0].yaxis.set_major_formatter(FormatStrFormatter('%.3f'))
+                axes[i][0].xaxis.set_major_formatter(tick_formatter)
+                axes[i][0].yaxis.set_major_formatter(tick_formatter)
                 # Minor ticks
-                axes[i][0].xaxis.set_minor_formatter(FormatStrFormatter('%.3f'))
-                axes[i][0].yaxis.set_minor_formatter(FormatStrFormatter('%.3f'))
+                axes[i][0].xaxis.set_minor_formatter(tick_formatter)
+                axes[i][0].yaxis.set_minor_formatter(tick_formatter)
                 # Draw 0,0 lines
                 axes[i][0].axhline()
                 axes[i][0].axvline()
                 # x&y std deviation box
-                x_sigma = np.around(np.std(data[0]),3)
-                y_sigma = np.around(np.std(data[1]),3)
+                (x_sigma, y_sigma) = toolSigmas[i]
                 axes[i][0].add_patch(patches.Rectangle((-1*x_sigma,-1*y_sigma), 2*x_sigma, 2*y_sigma, color="green",fill=False, linestyle='dotted'))
                 axes[i][0].add_patch(patches.Rectangle((-2*x_sigma,-2*y_sigma), 4*x_sigma, 4*y_sigma, color="red",fill=False, linestyle='-.'))
                 
@@ -2131,18 +2327,14 @@ class App(QMainWindow):
                 y_intervals = int(np.around(math.sqrt(len(data[1])),0)+1)
                 
                 # plot histograms
-                x_kwargs = dict(alpha=0.5, bins=x_intervals,rwidth=.92, density=True)
-                n, bins, hist_patches = axes[i][1].hist([data[0],data[1]],**x_kwargs, color=[colors[0],colors[1]], label=['X','Y'])
+                n, bins, hist_patches = axes[i][1].hist([data[0],data[1]], bins=x_intervals, **hist_kwargs)
                 axes[i][2].hist2d(data[0], data[1], bins=x_intervals, cmap='Blues')
                 axes[i][1].legend()
 
 
                 # add a 'best fit' line
                 # calculate mean and std deviation per axis
-                x_mean = np.mean(data[0])
-                y_mean = np.mean(data[1])
-                x_sigma = np.around(np.std(data[0]),3)
-                y_sigma = np.around(np.std(data[1]),3)
+                (x_mean, y_mean) = toolMeans[i]
                 # calculate function lines for best fit
                 x_best = ((1 / (np.sqrt(2 * np.pi) * x_sigma)) *
                     np.exp(-0.5 * (1 / x_sigma * (bins - x_mean))**2))
@@ -2152,20 +2344,20 @@ class App(QMainWindow):
                 axes[i][1].plot(bins, x_best, '-.',color=colors[0])
                 axes[i][1].plot(bins, y_best, '--',color=colors[1])
 
-                x_count = int(sum( p == True for p in ((data[0] >= (x_mean - x_sigma)) & (data[0] <= (x_mean + x_sigma))) )/len(data[0])*100)
-                y_count = int(sum( p == True for p in ((data[1] >= (y_mean - y_sigma)) & (data[1] <= (y_mean + y_sigma))) )/len(data[1])*100)
+                x_count = int(np.count_nonzero((data[0] >= (x_mean - x_sigma)) & (data[0] <= (x_mean + x_sigma)))/len(data[0])*100)
+                y_count = int(np.count_nonzero((data[1] >= (y_mean - y_sigma)) & (data[1] <= (y_mean + y_sigma)))/len(data[1])*100)
                 # annotate std dev values
-                annotation_text = "Xσ: " + str(x_sigma) + " ("+str(x_count) + "%)"
+                annotation_text = f"Xσ: {x_sigma} ({x_count}%)"
                 if x_count < 68:
-                    x_count = int(sum( p == True for p in ((data[0] >= (x_mean - 2*x_sigma)) & (data[0] <= (x_mean + 2*x_sigma))) )/len(data[0])*100) 
-                    annotation_text += " --> 2σ: " + str(x_count) + "%"
+                    x_count = int(np.count_nonzero((data[0] >= (x_mean - 2*x_sigma)) & (data[0] <= (x_mean + 2*x_sigma)))/len(data[0])*100)
+                    annotation_text += f" --> 2σ: {x_count}%"
                     if x_count < 95 and x_sigma*2 > 0.1:
                         annotation_text += " -- check axis!"
                     else: annotation_text += " -- OK"
-                annotation_text += "\nYσ: " + str(y_sigma) + " ("+str(y_count) + "%)"
+                annotation_text += f"\nYσ: {y_sigma} ({y_count}%)"
                 if y_count < 68: 
-                    y_count = int(sum( p == True for p in ((data[1] >= (y_mean - 2*y_sigma)) & (data[1] <= (y_mean + 2*y_sigma))) )/len(data[1])*100) 
-                    annotation_text += " --> 2σ: " + str(y_count) + "%"
+                    y_count = int(np.count_nonzero((data[1] >= (y_mean - 2*y_sigma)) & (data[1] <= (y_mean + 2*y_sigma)))/len(data[1])*100)
+                    annotation_text += f" --> 2σ: {y_count}%"
                     if y_count < 95 and y_sigma*2 > 0.1:
                         annotation_text += " -- check axis!"
                     else: annotation_text += " -- OK"
@@ -2173,7 +2365,7 @@ class App(QMainWindow):
                 axes[i][0].annotate('σ',(1.1*x_sigma,-1.1*y_sigma),xycoords='data',color='green')
                 axes[i][0].annotate('2σ',(1.1*2*x_sigma,-1.1*2*y_sigma),xycoords='data',color='red')
                 # # place title for graph
-                axes[i][0].set_ylabel("Tool " + str(i) + "\nY")
+                axes[i][0].set_ylabel(f"Tool {i}\nY")
                 axes[i][0].set_xlabel("X")
                 axes[i][2].set_ylabel("Y")
                 axes[i][2].set_xlabel("X")
@@ -2202,20 +2394,22 @@ class App(QMainWindow):
         ###################################################################################
         # Report on repeated executions
         ###################################################################################
-        print('')
-        print('Repeatability statistics for '+str(self.cycles)+' repeats:')
-        print('+-------------------------------------------------------------------------------------------------------+')
-        print('|   |                   X                             |                        Y                        |')
-        print('| T |   Avg   |   Max   |   Min   |  StdDev |  Range  |   Avg   |   Max   |   Min   |  StdDev |  Range  |')
+        # build the whole table and write it to the terminal in one go
+        border = '+-------------------------------------------------------------------------------------------------------+'
+        rows = [
+            '',
+            f'Repeatability statistics for {self.cycles} repeats:',
+            border,
+            '|   |                   X                             |                        Y                        |',
+            '| T |   Avg   |   Max   |   Min   |  StdDev |  Range  |   Avg   |   Max   |   Min   |  StdDev |  Range  |'
+        ]
+        (tools, cycles, X, Y, mpp) = self.calibrationColumns()
         for index in range(self.num_tools):
             # create array of results for current tool
-            _rawCalibrationData = [line for line in self.calibrationResults if line['tool'] == str(index)]
-            x_array = [float(line['X']) for line in _rawCalibrationData]
-            y_array = [float(line['Y']) for line in _rawCalibrationData]
-            mpp_value = np.average([float(line['mpp']) for line in _rawCalibrationData])
-            cycles = np.max(
-                [float(line['cycle']) for line in _rawCalibrationData]
-            )
+            mask = tools == index
+            x_array = X[mask]
+            y_array = Y[mask]
+            mpp_value = np.average(mpp[mask])
             x_avg = np.average(x_array)
             y_avg = np.average(y_array)
             x_min = np.min(x_array)
@@ -2226,39 +2420,39 @@ class App(QMainWindow):
             y_std = np.std(y_array)
             x_ran = x_max - x_min
             y_ran = y_max - y_min
-            print('| {0:1.0f} '.format(index) 
-                + '| {0:7.3f} '.format(x_avg)
-                + '| {0:7.3f} '.format(x_max)
-                + '| {0:7.3f} '.format(x_min)
-                + '| {0:7.3f} '.format(x_std)
-                + '| {0:7.3f} '.format(x_ran)
-                + '| {0:7.3f} '.format(y_avg)
-                + '| {0:7.3f} '.format(y_max)
-                + '| {0:7.3f} '.format(y_min)
-                + '| {0:7.3f} '.format(y_std)
-                + '| {0:7.3f} '.format(y_ran)
-                + '|'
-            )        
-        print('+-------------------------------------------------------------------------------------------------------+')
-        print('Note: Repeatability cannot be better than one pixel (MPP=' + str(mpp_value) + ').')
-
-    def parseData( self, rawData ):
-        # create empty output array
+            rows.append(f'| {index:1.0f} '
+                f'| {x_avg:7.3f} | {x_max:7.3f} | {x_min:7.3f} | {x_std:7.3f} | {x_ran:7.3f} '
+                f'| {y_avg:7.3f} | {y_max:7.3f} | {y_min:7.3f} | {y_std:7.3f} | {y_ran:7.3f} |'
+            )
+        rows.append(border)
+        rows.append(f'Note: Repeatability cannot be better than one pixel (MPP={mpp_value}).')
+        sys.stdout.write('\n'.join(rows) + '\n')
+        sys.stdout.flush()
+
+    def parseData( self ):
+        # create empty output arrays
         toolDataResult = []
+        toolMeans = []
+        toolSigmas = []
+        # split the numeric calibration columns per tool with masks
+        (tools, cycles, X, Y, mpp) = self.calibrationColumns()
         # get number of tools
-        _numTools = np.max([ int(line['tool']) for line in rawData ]) + 1
-        _cycles = np.max([ int(line['cycle']) for line in rawData ])
+        _numTools = int(tools.max()) + 1
+        _cycles = int(cycles.max())
         
         for i in range(_numTools):
-            x = [float(line['X']) for line in rawData if int(line['tool']) == i]
-            y = [float(line['Y']) for line in rawData if int(line['tool']) == i]
+            mask = tools == i
+            x = X[mask]
+            y = Y[mask]
             # variable to hold return data coordinates per tool formatted as a 2D array [x_value, y_value]
             tempPairs = []
 
             # calculate stats
             # mean values
-            x_mean = np.around(np.mean(x),3)
-            y_mean = np.around(np.mean(y),3)
+            x_raw_mean = np.mean(x)
+            y_raw_mean = np.mean(y)
+            x_mean = np.around(x_raw_mean,3)
+            y_mean = np.around(y_raw_mean,3)
             # median values
             x_median = np.around(np.median(x),3)
             y_median = np.around(np.median(y),3)
@@ -2279,36 +2473,36 @@ class App(QMainWindow):
 
             # add data to return object
             toolDataResult.append(tempPairs)
+            # mean of the normalized data (what is left after subtracting the rounded mean) and sigmas
+            toolMeans.append((x_raw_mean - x_mean, y_raw_mean - y_mean))
+            toolSigmas.append((x_sig, y_sig))
         # return dataset
-        return ( _numTools, _cycles, toolDataResult )
+        return ( _numTools, _cycles, toolDataResult, toolMeans, toolSigmas )
 
+    @pyqtSlot()
     def disconnectFromPrinter(self):
-        # temporarily suspend GUI and display status message
-        self.image_label.setText('Restoring machine to initial state..')
-        self.updateStatusbar('Restoring machine and disconnecting...')
-        self.connection_button.setText('Pending..')
-        self.connection_button.setDisabled(True)
-        self.disconnection_button.setDisabled(True)
-        self.calibration_button.setDisabled(True)
-        self.cp_button.setDisabled(True)
-        self.cp_button.setText('Pending..')
-        self.jogpanel_button.setDisabled(True)
-        self.offsets_box.setVisible(False)
-        self.connection_status.setText('Disconnecting..')
-        self.connection_status.setStyleSheet(style_orange)
-        self.cp_label.setText('<b>CP:</b> <i>undef</i>')
-        self.cp_label.setStyleSheet(style_orange)
-        self.repeatSpinBox.setDisabled(True)
-        self.xray_box.setDisabled(True)
-        self.xray_box.setChecked(False)
-        self.loose_box.setDisabled(True)
-        self.toolBox.setVisible(False)
-        self.min_thslider_label.setVisible(False)
-        self.min_thslider.setVisible(False)
-        self.max_thslider_label.setVisible(False)
-        self.max_thslider.setVisible(False)
-        self.set_thres_button.setVisible(False)
-        self.repaint()
+        with updatesSuspended(self):
+            # temporarily suspend GUI and display status message
+            self.image_label.setText('Restoring machine to initial state..')
+            self.updateStatusbar('Restoring machine and disconnecting...')
+            self.connection_button.setText('Pending..')
+            self.connection_button.setDisabled(True)
+            self.disconnection_button.setDisabled(True)
+            self.calibration_button.setDisabled(True)
+            self.cp_button.setDisabled(True)
+            self.cp_button.setText('Pending..')
+            self.jogpanel_button.setDisabled(True)
+            self.offsets_box.setVisible(False)
+            self.connection_status.setText('Disconnecting..')
+            applyState(self.connection_status, 'orange')
+            self.cp_label.setText('<b>CP:</b> <i>undef</i>')
+            applyState(self.cp_label, 'orange')
+            self.repeatSpinBox.setDisabled(True)
+            self.xray_box.setDisabled(True)
+            self.xray_box.setChecked(False)
+            self.loose_box.setDisabled(True)
+            self.toolBox.setVisible(False)
+            self.setThresholdControlsVisible(False)
         # End video threads and restart default thread
         # Clean up threads and detection
         self.video_thread.alignment = False
@@ -2319,50 +2513,57 @@ class App(QMainWindow):
 
         # update status 
         self.updateStatusbar('Unloading tools and disconnecting from machine..')
-        # Wait for printer to stop moving and unload tools
-        _ret_error = self.printer.gCode('M400')
-        if self.printer.isIdle():
-            tempCoords = self.printer.getCoords()
-            _ret_error += self.printer.gCode('T-1')
-            # return carriage to controlled point position
-            if len(self.cp_coords) > 0:
-                _ret_error += self.printer.gCode('G1 X' + str(self.cp_coords['X']))
-                _ret_error += self.printer.gCode('G1 Y' + str(self.cp_coords['Y']))
-                _ret_error += self.printer.gCode('G1 Z' + str(self.cp_coords['Z']))
-            else:
-                _ret_error += self.printer.gCode('G1 X' + str(tempCoords['X']))
-                _ret_error += self.printer.gCode('G1 Y' + str(tempCoords['Y']))
-                _ret_error += self.printer.gCode('G1 Z' + str(tempCoords['Z']))
-        # update status with disconnection state
-        if _ret_error == 0:
-            self.updateStatusbar('Disconnected.')
-            self.image_label.setText('Disconnected.')
-        else: 
-            # handle unforeseen disconnection error (power loss?)
-            self.statusBar.showMessage('Disconnect: error communicating with machine.')
-            self.statusBar.setStyleSheet(style_red)
-        # Reinitialize printer object
-        self.printer = None
+        # unload tools on printer_pool, finishDisconnect picks up from there
+        self.printer_pool.submit(self.restoreMachine, self.printer, dict(self.cp_coords))
+
+    def restoreMachine(self, printer, cp_coords):
+        # runs on printer_pool; report back through the signal
+        try:
+            # Wait for printer to stop moving and unload tools
+            _ret_error = printer.gCode('M400')
+            if printer.isIdle():
+                # unload and return carriage to controlled point position (or the current position) in one request
+                cp = cp_coords if len(cp_coords) > 0 else printer.getCoords()
+                _ret_error += printer.gCode(f"T-1\nG90 G1 X{cp['X']} Y{cp['Y']} Z{cp['Z']}")
+        except Exception as e1:
+            print('Error restoring machine state: ', e1)
+            _ret_error = 1
+        self.disconnect_signal.emit(_ret_error)
+
+    @pyqtSlot(int)
+    def finishDisconnect(self, _ret_error):
+        with updatesSuspended(self):
+            # update status with disconnection state
+            if _ret_error == 0:
+                self.updateStatusbar('Disconnected.')
+                self.image_label.setText('Disconnected.')
+            else: 
+                # handle unforeseen disconnection error (power loss?)
+                self.statusBar.showMessage('Disconnect: error communicating with machine.')
+                applyStyle(self.statusBar, style_red)
+            # Reinitialize printer object
+            self.printer = None
         
-        # Tools unloaded, reset GUI
-        self.image_label.setText('Welcome to TAMV. Enter your printer address and click \"Connect..\" to start.')
-        self.connection_button.setText('Connect..')
-        self.connection_button.setDisabled(False)
-        self.disconnection_button.setDisabled(True)
-        self.calibration_button.setDisabled(True)
-        self.cp_button.setDisabled(True)
-        self.cp_button.setText('Set Controlled Point..')
-        self.jogpanel_button.setDisabled(True)
-        self.offsets_box.setVisible(False)
-        self.connection_status.setText('Disconnected.')
-        self.connection_status.setStyleSheet(style_red)
-        self.cp_label.setText('<b>CP:</b> <i>undef</i>')
-        self.cp_label.setStyleSheet(style_red)
-        self.repeatSpinBox.setDisabled(True)
-        self.xray_box.setDisabled(True)
-        self.loose_box.setDisabled(True)
-        self.resetConnectInterface()
+            # Tools unloaded, reset GUI
+            self.image_label.setText('Welcome to TAMV. Enter your printer address and click \"Connect..\" to start.')
+            self.connection_button.setText('Connect..')
+            self.connection_button.setDisabled(False)
+            self.disconnection_button.setDisabled(True)
+            self.calibration_button.setDisabled(True)
+            self.cp_button.setDisabled(True)
+            self.cp_button.setText('Set Controlled Point..')
+            self.jogpanel_button.setDisabled(True)
+            self.offsets_box.setVisible(False)
+            self.connection_status.setText('Disconnected.')
+            applyState(self.connection_status, 'red')
+            self.cp_label.setText('<b>CP:</b> <i>undef</i>')
+            applyState(self.cp_label, 'red')
+            self.repeatSpinBox.setDisabled(True)
+            self.xray_box.setDisabled(True)
+            self.loose_box.setDisabled(True)
+            self.resetConnectInterface()
 
+    @pyqtSlot()
     def runCalibration(self):
         # reset debugString
         self.debugString = ''
@@ -2373,7 +2574,7 @@ class App(QMainWindow):
         msgBox.setWindowTitle('Start Calibration')
         yes_button = msgBox.addButton('Start calibration..',QMessageBox.YesRole)
         yes_button.setObjectName('active')
-        yes_button.setStyleSheet(style_green)
+        applyStyle(yes_button, style_green)
         no_button = msgBox.addButton('Cancel',QMessageBox.NoRole)
 
         returnValue = msgBox.exec_()
@@ -2385,29 +2586,27 @@ class App(QMainWindow):
                 self.camera_dialog.reject()
         except: None
         # update GUI
-        self.cp_button.setDisabled(True)
-        self.jogpanel_button.setDisabled(False)
-        self.calibration_button.setDisabled(True)
-        self.xray_box.setDisabled(False)
-        self.xray_box.setChecked(False)
-        self.xray_box.setVisible(True)
-        self.loose_box.setDisabled(False)
-        self.loose_box.setChecked(False)
-        self.loose_box.setVisible(True)
-        self.invert_box.setDisabled(False)
-        self.invert_box.setChecked(False)
-        self.invert_box.setVisible(True)
-        self.toolBox.setVisible(False)
-        self.detect_box.setVisible(False)
-        for i in range(self.num_tools):
-            current_tool = self.printer.getG10ToolOffset(i)
-            x_tableitem = QTableWidgetItem("{:.3f}".format(current_tool['X']))
-            y_tableitem = QTableWidgetItem("{:.3f}".format(current_tool['Y']))
-            x_tableitem.setBackground(QColor(255,255,255,255))
-            y_tableitem.setBackground(QColor(255,255,255,255))
-            self.offsets_table.setVerticalHeaderItem(i,QTableWidgetItem('T'+str(i)))
-            self.offsets_table.setItem(i,0,x_tableitem)
-            self.offsets_table.setItem(i,1,y_tableitem)
+        with updatesSuspended(self):
+            self.cp_button.setDisabled(True)
+            self.jogpanel_button.setDisabled(False)
+            self.calibration_button.setDisabled(True)
+            self.xray_box.setDisabled(False)
+            self.xray_box.setChecked(False)
+            self.xray_box.setVisible(True)
+            self.loose_box.setDisabled(False)
+            self.loose_box.setChecked(False)
+            self.loose_box.setVisible(True)
+            self.invert_box.setDisabled(False)
+            self.invert_box.setChecked(False)
+            self.invert_box.setVisible(True)
+            self.toolBox.setVisible(False)
+            self.detect_box.setVisible(False)
+        try:
+            tool_offsets = self.printer.getToolOffsets()
+        except Exception as e1:
+            print('Batched tool offset request failed: ', e1)
+            tool_offsets = [self.printer.getG10ToolOffset(i) for i in range(self.num_tools)]
+        self.fillOffsetsTable(tool_offsets[:self.num_tools])
         # get number of repeat cycles
         self.repeatSpinBox.setDisabled(True)
         self.cycles = self.repeatSpinBox.value()
@@ -2416,9 +2615,11 @@ class App(QMainWindow):
         self.video_thread.display_crosshair = True
         self.video_thread.detection_on = True
         self.video_thread.xray = False
-        self.video_thread.loose = False
+        self.video_thread.setLoose(False)
         self.video_thread.alignment = True
+        self.video_thread.wake()
 
+    @pyqtSlot()
     def toggle_xray(self):
         try:
             self.video_thread.toggleXray()
@@ -2427,14 +2628,16 @@ class App(QMainWindow):
             print( 'Detection thread error in XRAY: ')
             print(e1)
 
+    @pyqtSlot()
     def toggle_loose(self):
         try:
-            self.video_thread.toggleLoose()
+            self.video_thread.setLoose(self.loose_box.isChecked())
         except Exception as e1:
             self.updateStatusbar('Detection thread not running.')
             print( 'Detection thread error in LOOSE: ')
             print(e1)
 
+    @pyqtSlot()
     def toggle_invert(self):
         try:
             self.video_thread.toggleInvert()
@@ -2451,60 +2654,47 @@ class App(QMainWindow):
     def updateMessagebar(self, statusCode ):
         self.image_label.setText(statusCode)
 
-    @pyqtSlot(np.ndarray)
-    def update_image(self, cv_img):
-        #self.mutex.lock()
-        self.current_frame = cv_img
-        if self.crosshair:
-            # Draw alignment circle on image
-            alpha = 0.5
-            beta = 1-alpha
-            center = ( int(camera_width/2), int(camera_height/2) )
-            overlay = cv2.circle( 
-                cv_img.copy(), 
-                center, 
-                6, 
-                (0,255,0), 
-                int( camera_width/1.75 )
-            )
-            overlay = cv2.circle( 
-                overlay.copy(), 
-                center, 
-                5, 
-                (0,0,255), 
-                2
-            )
-            for i in range(0,8):
-                overlay = cv2.circle( 
-                overlay.copy(), 
-                center, 
-                25*i, 
-                (0,0,0), 
-                1
-            )
-            overlay = cv2.line(overlay, (center[0],center[1]-int( camera_width/3 )), (center[0],center[1]+int( camera_width/3 )), (128, 128, 128), 1)
-            overlay = cv2.line(overlay, (center[0]-int( camera_width/3 ),center[1]), (center[0]+int( camera_width/3 ),center[1]), (128, 128, 128), 1)
-            cv_img = cv2.addWeighted(overlay, beta, cv_img, alpha, 0)
-        # Updates the image_label with a new opencv image
-        qt_img = self.convert_cv_qt(cv_img)
-        self.image_label.setPixmap(qt_img)
-        #self.mutex.unlock()
-
-    def convert_cv_qt(self, cv_img):
-        # Convert from an opencv image to QPixmap
-        rgb_image = cv2.cvtColor(cv_img, cv2.COLOR_BGR2RGB)
-        h, w, ch = rgb_image.shape
+    @pyqtSlot(int)
+    def update_image(self, index):
+        # coalesce queued frames: if the worker has already emitted a newer slot, skip this one and paint that instead
+        if index != (self.video_thread.ring_idx - 1) % len(self.video_thread.ring):
+            return
+        # Updates the image_label with a new frame from the video thread's ring buffer
+        qt_img = self.convert_cv_qt(self.video_thread.ring[index])
+        self.image_label.setPixmap(QPixmap.fromImage(qt_img))
+
+    def convert_cv_qt(self, frame):
+        # Wrap a BGR (RGB before Qt 5.14) ring buffer in a QImage, fromImage copies it into the pixmap
+        # emitFrame already fitted the frame to the display, so no Qt scaling is needed here
+        h, w, ch = frame.shape
         bytes_per_line = ch * w
-        convert_to_Qt_format = QImage(rgb_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-        p = convert_to_Qt_format.scaled(display_width, display_height, Qt.KeepAspectRatio)
-        return QPixmap.fromImage(p)
+        convert_to_Qt_format = QImage(frame.data, w, h, bytes_per_line, qimage_bgr888 if qimage_bgr888 is not None else QImage.Format_RGB888)
+        return convert_to_Qt_format
 
     def addCalibrationResult(self, result={}):
+        # convert once on arrival into the typed columns, doubling them when full
+        count = len(self.calibrationResults)
+        if count == len(self.calibrationData['tool']):
+            for key in self.calibrationData:
+                self.calibrationData[key] = np.resize(self.calibrationData[key], 2*count)
+        for (key, dtype) in calibration_fields:
+            self.calibrationData[key][count] = dtype(result[key])
         self.calibrationResults.append(result)
 
+    def calibrationColumns(self):
+        # views of the filled rows, in calibration_fields order
+        count = len(self.calibrationResults)
+        return tuple( self.calibrationData[key][:count] for (key, dtype) in calibration_fields )
+
 if __name__=='__main__':
     os.putenv("QT_LOGGING_RULES","qt5ct.debug=false")
     app = QApplication(sys.argv)
+    # application-wide stylesheet, set before any widget exists so each widget is polished once
+    try:
+        with open('tamv.qss','r') as stylesheet:
+            app.setStyleSheet(stylesheet.read())
+    except FileNotFoundError:
+        print('Stylesheet tamv.qss not found, using default style.')
     a = App()
     a.show()
     sys.exit(app.exec_())